@@ -12,7 +12,11 @@ and cache it in Streamlit's cache with 1-hour TTL.
 
 from __future__ import annotations
 
+import atexit
+import concurrent.futures
 import logging
+import queue
+import threading
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -54,36 +58,48 @@ except Exception:  # pragma: no cover - environment dependent
 # Symbols exported when this module is imported elsewhere (tests)
 __all__ = ["filter_providers_by_radius", "geocode_address", "GEOPY_AVAILABLE", "show_auto_update_status"]
 
+# In-process channel for worker→main status messages. A bounded queue is safe
+# to use from background threads (unlike st.session_state) and avoids the
+# write/read/unlink filesystem round-trip of the old status-file approach,
+# which ran on every Streamlit rerun.
+_STATUS_QUEUE: "queue.Queue[str]" = queue.Queue(maxsize=4)
+
+
+def _post_status(msg: str) -> None:
+    """Queue a status message for display on the next page render.
+
+    Drops the message if the queue is full (stale statuses aren't worth
+    blocking the background worker for).
+    """
+    try:
+        _STATUS_QUEUE.put_nowait(msg)
+    except queue.Full:
+        pass
+
 
 def show_auto_update_status():
     """
     Display the auto-update status message if available.
 
     This function can be called from any page to show the result
-    of the automatic data loading that occurs on app launch.
+    of the automatic data loading that occurs on app launch. Safe to call
+    on every rerun: the empty-queue case is a single non-blocking get with
+    no syscalls, so no rate limiting is needed.
     """
-    # Prefer a status file written by the background updater (safer than
-    # accessing session state from background threads). If the file exists,
-    # show its content once and then remove it.
-    status_file = Path("data/processed/data_auto_update_status.txt")
+    # Status messages are passed in-memory from the background updater
+    # (safer than accessing session state from background threads). Each
+    # message is shown once; an empty queue is the common case and costs
+    # only a non-blocking get.
     try:
-        if status_file.exists():
-            text = status_file.read_text(encoding="utf-8").strip()
-            if text.startswith("✅"):
-                st.success(text)
-            elif text.startswith("❌"):
-                st.error(text)
-            else:
-                st.info(text)
-            try:
-                status_file.unlink()
-            except Exception:
-                # If deletion fails, ignore — it's just a convenience file
-                pass
-            return
-    except Exception:
-        # If anything goes wrong reading the file, fall back silently
+        text = _STATUS_QUEUE.get_nowait().strip()
+    except queue.Empty:
         return
+    if text.startswith("✅"):
+        st.success(text)
+    elif text.startswith("❌"):
+        st.error(text)
+    else:
+        st.info(text)
 
 
 def auto_update_data():
@@ -92,11 +108,10 @@ def auto_update_data():
 
     Loads data from local parquet files and warms Streamlit's cache.
     Runs in background thread.
-    Writes status to data/processed/data_auto_update_status.txt for UI display.
+    Queues a status message for UI display via show_auto_update_status().
     """
     # Background worker: avoid Streamlit APIs (no st.* calls)
-    # Write status file for main thread to read
-    status_file = Path("data/processed/data_auto_update_status.txt")
+    # Queue status message for main thread to display
     try:
         from src.data.ingestion import get_data_manager
 
@@ -107,28 +122,16 @@ def auto_update_data():
             data_manager.preload_data()
             msg = "✅ Data loading complete: Loaded from local parquet files and cached"
             logger.info(msg)
-            try:
-                status_file.parent.mkdir(parents=True, exist_ok=True)
-                status_file.write_text(msg, encoding="utf-8")
-            except Exception:
-                logger.exception("Failed to write status file")
+            _post_status(msg)
         except Exception as e:
             logger.exception(f"Data loading process failed: {e}")
-            try:
-                status_file.parent.mkdir(parents=True, exist_ok=True)
-                status_file.write_text(f"❌ Data loading process failed: {e}", encoding="utf-8")
-            except Exception:
-                pass
+            _post_status(f"❌ Data loading process failed: {e}")
 
     except ImportError as e:
         logger.info(f"Data ingestion module not available - skipping data loading: {e}")
     except Exception as e:
         logger.exception(f"Unexpected error during data loading: {e}")
-        try:
-            status_file.parent.mkdir(parents=True, exist_ok=True)
-            status_file.write_text(f"❌ Data loading process failed: {e}", encoding="utf-8")
-        except Exception:
-            pass
+        _post_status(f"❌ Data loading process failed: {e}")
 
 
 # Exclude this module from navigation to avoid import recursion
@@ -142,12 +145,32 @@ _nav_items = [
     ("pages/30_🔄_Update_Data.py", "Update Data", "🔄"),
 ]
 
+# Filter once at import time; _build_and_run_app runs on every rerun and only
+# needs to construct the st.Page objects (which are tied to the script run and
+# cannot be cached across reruns).
+_FILTERED_NAV_ITEMS = tuple(item for item in _nav_items if item[0] != _current_file)
+
+
+# Set once per process so the background data load runs only on the first
+# rerun. Streamlit re-executes _build_and_run_app on every widget interaction;
+# without this gate each rerun would re-fire the ingestion pipeline.
+_STARTUP_DONE = threading.Event()
+
+# Single shared worker for background ingestion: submitting work is a queue
+# append rather than an OS thread spawn, and the pool is reused if more
+# background jobs are added later.
+_BG_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="medmatch-ingest")
+atexit.register(_BG_POOL.shutdown, wait=False)
+
 
 def _build_and_run_app():
     """Build navigation and trigger data loading processes.
 
     Orchestrates daily cache refresh (synchronous) and background data loading on app launch.
     Intentionally encapsulated to prevent duplicate rendering when pages import app.
+    The background load runs once per process (guarded by _STARTUP_DONE); the
+    daily-refresh check runs on every rerun so the 4 AM boundary is noticed in
+    long-running servers — its own per-session throttle keeps the cost down.
     """
 
     # Check for daily refresh (may trigger full data reload if after 4 AM)
@@ -160,16 +183,16 @@ def _build_and_run_app():
     except Exception as e:
         logger.warning(f"Could not check daily refresh on app load: {e}")
 
-    nav_pages = [st.Page(path, title=title, icon=icon) for path, title, icon in _nav_items if path != _current_file]
+    if not _STARTUP_DONE.is_set():
+        _STARTUP_DONE.set()
 
-    import threading
+        # Run data loading on the background pool to avoid blocking app startup
+        try:
+            _BG_POOL.submit(auto_update_data)
+        except Exception:
+            auto_update_data()  # Fallback to synchronous
 
-    # Run data loading in background thread to avoid blocking app startup
-    try:
-        thread = threading.Thread(target=auto_update_data, daemon=True)
-        thread.start()
-    except Exception:
-        auto_update_data()  # Fallback to synchronous
+    nav_pages = [st.Page(path, title=title, icon=icon) for path, title, icon in _FILTERED_NAV_ITEMS]
 
     pg = st.navigation(nav_pages)
     pg.run()
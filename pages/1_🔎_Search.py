@@ -3,20 +3,17 @@ import datetime as dt
 import streamlit as st
 
 from app import show_auto_update_status
-from src.app_logic import get_unique_genders, get_unique_specialties, load_application_data
-from src.utils.addressing import validate_address_input
+from src.app_logic import load_application_data, load_search_options
+from src.utils.addressing import canonical_address, validate_address_input
 from src.utils.responsive import resp_columns
 
-try:
-    from src.utils.geocoding import geocode_address
-
-    GEOCODE_AVAILABLE = True
-except Exception:
-    geocode_address = None
-    GEOCODE_AVAILABLE = False
-
 from src.components.search_assistant import render_search_assistant
 
+# NOTE: src.utils.geocoding (and geopy behind it) is imported lazily inside
+# the search-click handler below. The page reruns on every widget
+# interaction and only needs the geocoder once a search is submitted, so
+# deferring the import keeps it off the cold-start and rerun paths.
+
 # Constants - define once at module level for performance
 PRESET_ADDRESSES = {
     "Baltimore": {"street": "100 N Charles St", "city": "Baltimore", "state": "MD", "zipcode": "21201"},
@@ -24,7 +21,7 @@ PRESET_ADDRESSES = {
     "Montgomery County": {"street": "12500 Parklawn Dr", "city": "Rockville", "state": "MD", "zipcode": "20852"},
 }
 
-US_STATES = [
+US_STATES = (
     "MD","AL","AK","AZ","AR",
     "CA","CO","CT","DE","FL",
     "GA","HI","ID","IL","IN",
@@ -36,7 +33,10 @@ US_STATES = [
     "SD","TN","TX","UT","VT",
     "VA","WA","WV","WI","WY",
     "DC",
-]
+)
+
+# State → position index for O(1) default-selection lookup on reruns
+_US_STATE_IDX = {s: i for i, s in enumerate(US_STATES)}
 
 st.set_page_config(page_title="MedMatch - Provider Recommender", page_icon="🏥", layout="wide")
 
@@ -84,8 +84,8 @@ st.divider()
 provider_count = len(provider_df)
 st.info(f"📊 **{provider_count:,} providers available** in our network")
 
-available_specialties = get_unique_specialties(provider_df)
-available_genders = get_unique_genders(provider_df)
+# Cached alongside the data load so the per-rerun cost is a cache lookup
+available_specialties, available_genders = load_search_options()
 
 st.divider()
 st.subheader("🤖 Search Assistant")
@@ -114,7 +114,7 @@ with st.expander("Or search manually", expanded=False):
     col3, col4 = resp_columns([1, 1])
 
     with col3:
-        default_index = US_STATES.index(prev_state) if prev_state in US_STATES else 0
+        default_index = _US_STATE_IDX.get(prev_state, 0)
 
         state = st.selectbox(
             "State", options=US_STATES, index=default_index, help="Select the client's state (2-letter abbreviation)"
@@ -297,9 +297,10 @@ with st.expander("Or search manually", expanded=False):
         st.session_state.pop("last_best", None)
         st.session_state.pop("last_scored_df", None)
 
-        # Construct full address from current form values
+        # Construct the canonical address once; it doubles as the geocode
+        # cache key, so equivalent inputs hit the same cache entry
         state_for_addr = state or ""
-        full_address = f"{street}, {city}, {state_for_addr} {zipcode}".strip(", ")
+        full_address = canonical_address(street, city, state_for_addr, zipcode)
 
         # Validate address
         addr_valid, addr_msg = validate_address_input(street, city, state_for_addr, zipcode)
@@ -309,7 +310,9 @@ with st.expander("Or search manually", expanded=False):
                 st.info(addr_msg)
             st.stop()
 
-        if not GEOCODE_AVAILABLE or geocode_address is None:
+        try:
+            from src.utils.geocoding import geocode_address
+        except Exception:
             st.error("❌ Geocoding service unavailable. Please contact support.")
             st.info("Technical note: geopy package is not installed")
             st.stop()
@@ -322,6 +325,9 @@ with st.expander("Or search manually", expanded=False):
             st.info(f"Tried to geocode: {full_address}")
             st.stop()
 
+        # All values below are already the right numeric types: the geocoder
+        # returns float coordinates, the sliders produce floats, and the
+        # number_input produces an int — no re-casting needed.
         user_lat, user_lon = coords
         st.session_state.update(
             {
@@ -329,13 +335,13 @@ with st.expander("Or search manually", expanded=False):
                 "city": city,
                 "state": state or "",
                 "zipcode": zipcode,
-                "user_lat": float(user_lat),
-                "user_lon": float(user_lon),
-                "alpha": float(alpha),
-                "beta": float(beta),
-                "distance_weight": float(distance_weight),
-                "client_weight": float(client_weight),
-                "max_radius_miles": int(max_radius_miles),
+                "user_lat": user_lat,
+                "user_lon": user_lon,
+                "alpha": alpha,
+                "beta": beta,
+                "distance_weight": distance_weight,
+                "client_weight": client_weight,
+                "max_radius_miles": max_radius_miles,
                 "selected_specialties": selected_specialties,
                 "selected_genders": selected_genders,
             }
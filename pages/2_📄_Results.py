@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import streamlit as st
 
@@ -8,13 +9,68 @@ except ImportError:
     PYDECK_AVAILABLE = False
 
 from src.app_logic import apply_time_filtering, load_application_data, run_recommendation, validate_provider_data
-from src.utils.io_utils import format_phone_number, get_word_bytes, sanitize_filename
+from src.utils.io_utils import format_phone_column, format_phone_number, get_word_bytes, sanitize_filename
 from src.utils.responsive import resp_columns
 from src.utils.freshness import format_last_verified_display
 
 
 st.set_page_config(page_title="Results", page_icon=":bar_chart:", layout="wide")
 
+
+@st.cache_data(show_spinner=False)
+def _cached_word_bytes(provider_name: str, payload_hash: str, best_dict: dict) -> bytes:
+    """Build the Word export once per provider payload.
+
+    docx generation runs on every rerun otherwise (download_button evaluates
+    its data argument eagerly); caching on the provider's name and a hash of
+    the row makes repeat renders free.
+    """
+    return get_word_bytes(pd.Series(best_dict))
+
+
+@st.cache_data(show_spinner=False)
+def _cached_recommendation(
+    df_hash: str,
+    user_lat: float,
+    user_lon: float,
+    min_clients: int,
+    max_radius_miles: int,
+    alpha: float,
+    beta: float,
+    specialties: tuple,
+    genders: tuple,
+    _provider_df: pd.DataFrame,
+):
+    """Memoized wrapper around run_recommendation.
+
+    Keyed on the scoring inputs plus a content hash of the provider frame
+    (the frame itself is passed underscore-prefixed so Streamlit skips
+    hashing it). Reruns with unchanged inputs reuse the scored results
+    instead of re-filtering and re-scoring. Display-formatted columns are
+    derived here too, so reruns don't re-round or re-format per render.
+    """
+    best, scored = run_recommendation(
+        _provider_df,
+        user_lat,
+        user_lon,
+        min_clients=min_clients,
+        max_radius_miles=max_radius_miles,
+        alpha=alpha,
+        beta=beta,
+        selected_specialties=list(specialties) if specialties else None,
+        selected_genders=list(genders) if genders else None,
+    )
+    if isinstance(scored, pd.DataFrame) and not scored.empty:
+        if "Distance (Miles)" in scored.columns:
+            scored["_display_distance"] = scored["Distance (Miles)"].round(1)
+        if "Score" in scored.columns:
+            scored["_display_score"] = scored["Score"].round(3)
+        if "Last Verified Date" in scored.columns:
+            scored["_display_last_verified"] = scored["Last Verified Date"].map(
+                lambda x: format_last_verified_display(x, include_age=False)
+            )
+    return best, scored
+
 # Search parameters summary header — works for both form and chatbot paths
 _addr_display = (
     f"{st.session_state['street']}, {st.session_state['city']}, {st.session_state['state']}"
@@ -34,18 +90,23 @@ if st.sidebar.button("← New Search", type="secondary", width="stretch"):
 
 st.sidebar.divider()
 st.sidebar.caption("**Your Search Criteria:**")
+
+# Single markdown blob — one front-end message instead of one per line
+_criteria_lines = []
 if "max_radius_miles" in st.session_state:
-    st.sidebar.write(f"📍 Radius: {st.session_state['max_radius_miles']} miles")
+    _criteria_lines.append(f"📍 Radius: {st.session_state['max_radius_miles']} miles")
 if "selected_specialties" in st.session_state and st.session_state["selected_specialties"]:
     specialties_str = ", ".join(st.session_state["selected_specialties"])
-    st.sidebar.write(f"🏥 Specialties: {specialties_str}")
+    _criteria_lines.append(f"🏥 Specialties: {specialties_str}")
 if "selected_genders" in st.session_state and st.session_state["selected_genders"]:
     genders_str = ", ".join(st.session_state["selected_genders"])
-    st.sidebar.write(f"👤 Genders: {genders_str}")
+    _criteria_lines.append(f"👤 Genders: {genders_str}")
 if "street" in st.session_state and "city" in st.session_state:
-    st.sidebar.write(f"🏠 From: {st.session_state.get('city', 'N/A')}, {st.session_state.get('state', 'N/A')}")
+    _criteria_lines.append(f"🏠 From: {st.session_state.get('city', 'N/A')}, {st.session_state.get('state', 'N/A')}")
 elif "full_address" in st.session_state:
-    st.sidebar.write(f"🏠 From: {st.session_state['full_address']}")
+    _criteria_lines.append(f"🏠 From: {st.session_state['full_address']}")
+if _criteria_lines:
+    st.sidebar.markdown("\n\n".join(_criteria_lines))
 
 required_keys = ["user_lat", "user_lon", "alpha", "beta", "max_radius_miles"]
 if any(k not in st.session_state for k in required_keys):
@@ -84,30 +145,30 @@ if not valid and msg:
     # st.warning(msg)
     pass
 
-best = st.session_state.get("last_best")
-scored_df = st.session_state.get("last_scored_df")
-
-if best is None or scored_df is None or (isinstance(scored_df, pd.DataFrame) and scored_df.empty):
-    try:
-        best, scored_df = run_recommendation(
-            provider_df,
-            st.session_state["user_lat"],
-            st.session_state["user_lon"],
-            min_clients=st.session_state.get("min_clients", 0),
-            max_radius_miles=st.session_state["max_radius_miles"],
-            alpha=st.session_state["alpha"],
-            beta=st.session_state["beta"],
-            selected_specialties=st.session_state.get("selected_specialties"),
-            selected_genders=st.session_state.get("selected_genders"),
-        )
-        st.session_state["last_best"] = best
-        st.session_state["last_scored_df"] = scored_df
-    except Exception as e:
-        st.error("❌ Failed to calculate recommendations.")
-        st.info(f"Technical details: {str(e)}")
-        if st.button("← Back to Search"):
-            st.switch_page("pages/1_🔎_Search.py")
-        st.stop()
+try:
+    # Cache keyed on the actual inputs, so reruns recompute only when the
+    # address, filters, weights, or underlying data actually change
+    _df_hash = str(pd.util.hash_pandas_object(provider_df, index=False).sum())
+    best, scored_df = _cached_recommendation(
+        _df_hash,
+        st.session_state["user_lat"],
+        st.session_state["user_lon"],
+        st.session_state.get("min_clients", 0),
+        st.session_state["max_radius_miles"],
+        st.session_state["alpha"],
+        st.session_state["beta"],
+        tuple(sorted(st.session_state.get("selected_specialties") or [])),
+        tuple(sorted(st.session_state.get("selected_genders") or [])),
+        provider_df,
+    )
+    st.session_state["last_best"] = best
+    st.session_state["last_scored_df"] = scored_df
+except Exception as e:
+    st.error("❌ Failed to calculate recommendations.")
+    st.info(f"Technical details: {str(e)}")
+    if st.button("← Back to Search"):
+        st.switch_page("pages/1_🔎_Search.py")
+    st.stop()
 
 st.title("🎯 Provider Recommendations")
 
@@ -173,9 +234,14 @@ st.divider()
 # Export button in a prominent position
 try:
     base_filename = f"Provider_{sanitize_filename(provider_name)}"
+    if isinstance(best, pd.Series):
+        payload_hash = str(pd.util.hash_pandas_object(best.astype(str)).sum())
+        word_bytes = _cached_word_bytes(provider_name, payload_hash, best.to_dict())
+    else:
+        word_bytes = get_word_bytes(best)
     st.download_button(
         "📄 Export to Word Document",
-        data=get_word_bytes(best),
+        data=word_bytes,
         file_name=f"{base_filename}.docx",
         mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
         use_container_width=False,
@@ -202,38 +268,81 @@ available = [c for c in cols if c in scored_df.columns]
 if available:
     sort_col = "Score" if "Score" in available else available[0]
     sort_order = False if "Score" in available else True  # Score: descending, others: ascending
+    _display_cols = [
+        c for c in ("_display_distance", "_display_score", "_display_last_verified")
+        if c in scored_df.columns
+    ]
+    display_df = scored_df[available + _display_cols].drop_duplicates(subset=["Full Name"], keep="first")
+
+    # Select the top K with argpartition (O(N)) before sorting — the table
+    # widget only shows the leading rows, so a full sort of every match is
+    # wasted work on large result sets
+    _TABLE_TOP_K = 500
+    full_match_count = len(display_df)
+    if full_match_count > _TABLE_TOP_K and pd.api.types.is_numeric_dtype(display_df[sort_col]):
+        _vals = display_df[sort_col].to_numpy()
+        _top_idx = np.argpartition(_vals if sort_order else -_vals, _TABLE_TOP_K)[:_TABLE_TOP_K]
+        display_df = display_df.iloc[_top_idx]
+
     display_df = (
-        scored_df[available]
-        .drop_duplicates(subset=["Full Name"], keep="first")
+        display_df
         .sort_values(by=sort_col, ascending=sort_order)
         .reset_index(drop=True)
         .copy()  # Ensure we have a copy to modify
     )
 
-    # Format phone numbers - handle all possible phone field names
+    # Coalesce candidate phone columns into one Series, then format once —
+    # a single vectorized pass instead of an apply() per phone column
     phone_fields = ["Work Phone Number", "Work Phone", "Phone Number", "Phone 1"]
-    for phone_field in phone_fields:
-        if phone_field in display_df.columns:
-            display_df[phone_field] = display_df[phone_field].apply(format_phone_number)
+    existing_phone_fields = [f for f in phone_fields if f in display_df.columns]
+    if existing_phone_fields:
+        phones = display_df[existing_phone_fields[0]].copy()
+        for phone_field in existing_phone_fields[1:]:
+            phones = phones.combine_first(display_df[phone_field])
+        display_df["Work Phone Number"] = format_phone_column(phones)
+        display_df = display_df.drop(
+            columns=[f for f in existing_phone_fields if f != "Work Phone Number"]
+        )
 
-    # Format Last Verified Date with freshness indicator
-    if "Last Verified Date" in display_df.columns:
+    # Display formatting (freshness labels, rounding) is precomputed in the
+    # cached recommendation wrapper; reruns just move the columns into place,
+    # with the per-render formatting kept as a fallback
+    if "_display_last_verified" in display_df.columns:
+        display_df["Last Verified Date"] = display_df.pop("_display_last_verified")
+    elif "Last Verified Date" in display_df.columns:
         display_df["Last Verified Date"] = display_df["Last Verified Date"].apply(
             lambda x: format_last_verified_display(x, include_age=False)
         )
 
-    # Round distance to 1 decimal place for cleaner display
-    if "Distance (Miles)" in display_df.columns:
+    if "_display_distance" in display_df.columns:
+        display_df["Distance (Miles)"] = display_df.pop("_display_distance")
+    elif "Distance (Miles)" in display_df.columns:
         display_df["Distance (Miles)"] = display_df["Distance (Miles)"].round(1)
 
-    # Round score to 3 decimal places
-    if "Score" in display_df.columns:
+    if "_display_score" in display_df.columns:
+        display_df["Score"] = display_df.pop("_display_score")
+    elif "Score" in display_df.columns:
         display_df["Score"] = display_df["Score"].round(3)
 
     display_df.insert(0, "Rank", range(1, len(display_df) + 1))
 
-    st.caption(f"Showing {len(display_df)} provider(s) matching your criteria")
-    st.dataframe(display_df, hide_index=True, width="stretch", height=400)
+    # Paginate so each rerun ships one page to the browser, not every match
+    total_rows = len(display_df)
+    pg_col1, pg_col2, _ = st.columns([0.2, 0.2, 0.6])
+    page_size = pg_col1.selectbox("Rows per page", [25, 50, 100], index=1, key="results_page_size")
+    n_pages = max(1, -(-total_rows // page_size))
+    if st.session_state.get("results_page", 1) > n_pages:
+        st.session_state["results_page"] = n_pages
+    page = pg_col2.number_input("Page", min_value=1, max_value=n_pages, value=1, key="results_page")
+    start = (page - 1) * page_size
+    end = min(start + page_size, total_rows)
+
+    # Report the real match count, not the truncated table length
+    match_caption = f"Showing {start + 1}–{end} of {full_match_count} provider(s) matching your criteria"
+    if total_rows < full_match_count:
+        match_caption += f" (top {total_rows} by {sort_col} shown)"
+    st.caption(match_caption)
+    st.dataframe(display_df.iloc[start:end], hide_index=True, width="stretch", height=400)
 else:
     st.error("❌ No displayable columns in results.")
 
@@ -242,17 +351,28 @@ st.divider()
 # Map visualization
 st.subheader("🗺️ Provider Locations")
 
-# Prepare map data - filter to only providers with valid coordinates
-map_data = scored_df[scored_df['Latitude'].notna() & scored_df['Longitude'].notna()].copy()
+# Prepare map data - filter to only providers with valid coordinates, and
+# carry only the columns the map actually uses to keep the pydeck payload small
+_map_cols = ['Latitude', 'Longitude', 'Full Name', 'Distance (Miles)', 'Score', 'Specialty']
+map_data = scored_df.loc[
+    scored_df['Latitude'].notna() & scored_df['Longitude'].notna(),
+    [c for c in _map_cols if c in scored_df.columns],
+].copy()
 
 if not map_data.empty and PYDECK_AVAILABLE:
-    # Prepare provider locations for the map
-    map_data['lat'] = pd.to_numeric(map_data['Latitude'], errors='coerce')
-    map_data['lon'] = pd.to_numeric(map_data['Longitude'], errors='coerce')
-    
-    # Remove any remaining invalid coordinates
-    map_data = map_data.dropna(subset=['lat', 'lon'])
-    
+    # Prepare provider locations for the map. Coordinates are numeric after
+    # ingestion, in which case the notna() filter above already removed the
+    # invalid rows; only legacy string coords need the coerce + re-scan pass.
+    if pd.api.types.is_numeric_dtype(map_data['Latitude']) and pd.api.types.is_numeric_dtype(map_data['Longitude']):
+        map_data['lat'] = map_data['Latitude'].to_numpy()
+        map_data['lon'] = map_data['Longitude'].to_numpy()
+    else:
+        map_data['lat'] = pd.to_numeric(map_data['Latitude'], errors='coerce')
+        map_data['lon'] = pd.to_numeric(map_data['Longitude'], errors='coerce')
+
+        # Remove any remaining invalid coordinates
+        map_data = map_data.dropna(subset=['lat', 'lon'])
+
     if not map_data.empty:
         # Create tooltip-friendly column names (pydeck doesn't like spaces/parentheses)
         map_data['provider_name'] = map_data['Full Name'] if 'Full Name' in map_data.columns else 'Unknown'
@@ -269,18 +389,20 @@ if not map_data.empty and PYDECK_AVAILABLE:
         })
         
         # Add color coding for providers based on rank/score
-        # Top 3 providers get special colors, rest are blue
-        colors = []
-        for idx in range(len(map_data)):
-            if idx == 0:
-                colors.append([34, 139, 34, 200])  # Top: Green
-            elif idx == 1:
-                colors.append([255, 215, 0, 200])  # Second: Gold
-            elif idx == 2:
-                colors.append([255, 140, 0, 200])  # Third: Dark orange
-            else:
-                colors.append([100, 149, 237, 180])  # Others: Cornflower blue
-        map_data['color'] = colors
+        # Top 3 providers get special colors, rest are blue; built as one
+        # contiguous (N, 4) array with the top rows assigned by slice
+        colors = np.tile(np.array([100, 149, 237, 180], dtype=np.uint8), (len(map_data), 1))
+        top_colors = np.array(
+            [
+                [34, 139, 34, 200],  # Top: Green
+                [255, 215, 0, 200],  # Second: Gold
+                [255, 140, 0, 200],  # Third: Dark orange
+            ],
+            dtype=np.uint8,
+        )
+        n_top = min(3, len(map_data))
+        colors[:n_top] = top_colors[:n_top]
+        map_data['color'] = list(colors)
         
         # Set up the view centered on user location
         view_state = pdk.ViewState(
@@ -290,10 +412,17 @@ if not map_data.empty and PYDECK_AVAILABLE:
             pitch=0,
         )
         
+        # Serialize only the fields the layer and tooltip reference — the
+        # DataFrame would ship every column to the browser
+        _layer_cols = ['lat', 'lon', 'provider_name', 'specialty', 'distance_miles', 'match_score']
+        provider_layer_data = map_data[_layer_cols].to_dict(orient='records')
+        for _rec, _color in zip(provider_layer_data, map_data['color']):
+            _rec['color'] = _color.tolist() if hasattr(_color, 'tolist') else _color
+
         # Create provider layer
         provider_layer = pdk.Layer(
             'ScatterplotLayer',
-            data=map_data,
+            data=provider_layer_data,
             get_position='[lon, lat]',
             get_color='color',
             get_radius=300,
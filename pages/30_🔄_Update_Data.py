@@ -34,10 +34,11 @@ def get_db_summary():
         import duckdb
         with duckdb.connect(str(DB_PATH), read_only=True) as con:
             provider_count = con.execute("SELECT COUNT(*) FROM providers").fetchone()[0]
-            address_count = con.execute("SELECT COUNT(*) FROM addresses").fetchone()[0]
             geocode_counts = con.execute(
                 "SELECT geocode_source, COUNT(*) AS n FROM addresses GROUP BY geocode_source"
             ).df()
+        # Total addresses falls out of the grouped counts — no second scan needed
+        address_count = int(geocode_counts["n"].sum()) if not geocode_counts.empty else 0
         return provider_count, address_count, geocode_counts
     except Exception:
         return None, None, None
@@ -33,12 +33,12 @@ def build_providers_table(
 ) -> int:
     """Clean raw data and write providers table to DuckDB. Returns row count."""
     cleaning = _load_cleaning_module()
-    df = cleaning.load_raw_provider_data(raw_path)
-    df = cleaning.clean_provider_data(
-        df,
+    df = cleaning.load_raw_provider_data(
+        raw_path,
         states=cleaning.DEFAULT_STATES,
         specialties=cleaning.DEFAULT_SPECIALTIES,
     )
+    df = cleaning.clean_provider_data(df)
 
     db_path.parent.mkdir(parents=True, exist_ok=True)
     now = datetime.now(timezone.utc)
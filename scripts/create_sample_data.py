@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+"""Generate a small sample Combined_Contacts_and_Reviews.parquet fixture.
+
+Builds a handful of synthetic Maryland providers matching the schema the
+app loads through DataIngestionManager, so the app can be demoed or
+tested without the full pipeline output.
+
+The table is constructed directly in PyArrow with an explicit schema —
+dictionary-encoded gndr/pri_spec, int32 patient counts, float32 ratings —
+instead of round-tripping through a pandas DataFrame, which would
+type-infer every string column as object and inflate the file.
+
+Usage:
+    python scripts/create_sample_data.py [output_path]
+"""
+
+import sys
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+DEFAULT_OUTPUT_PATH = PROJECT_ROOT / "data" / "processed" / "Combined_Contacts_and_Reviews.parquet"
+
+# Columns the app actually reads from the combined parquet (see
+# DataIngestionManager._transform_combined_data for the mapping to the
+# standardized schema). Readers can project to this list instead of
+# materializing every pipeline column.
+REQUIRED_COLUMNS = (
+    "Ind_PAC_ID",
+    "Provider First Name",
+    "Provider Last Name",
+    "gndr",
+    "pri_spec",
+    "Telephone Number",
+    "Full Address",
+    "latitude",
+    "longitude",
+    "patient_count",
+    "star_value",
+)
+
+# Explicit schema: low-cardinality strings are dictionary-encoded so the
+# columns store int32 codes instead of repeated strings.
+SAMPLE_SCHEMA = pa.schema(
+    [
+        pa.field("Ind_PAC_ID", pa.int64()),
+        pa.field("Provider First Name", pa.string()),
+        pa.field("Provider Last Name", pa.string()),
+        pa.field("gndr", pa.dictionary(pa.int32(), pa.string())),
+        pa.field("pri_spec", pa.dictionary(pa.int32(), pa.string())),
+        pa.field("Telephone Number", pa.string()),
+        pa.field("Full Address", pa.string()),
+        pa.field("latitude", pa.float64()),
+        pa.field("longitude", pa.float64()),
+        pa.field("patient_count", pa.int32()),
+        pa.field("star_value", pa.float32()),
+    ]
+)
+
+SAMPLE_DATA = {
+    "Ind_PAC_ID": [1000000001, 1000000002, 1000000003, 1000000004, 1000000005, 1000000006],
+    "Provider First Name": ["Alice", "Brian", "Carmen", "David", "Elena", "Frank"],
+    "Provider Last Name": ["Anderson", "Brooks", "Castillo", "Dawson", "Edwards", "Fischer"],
+    "gndr": ["F", "M", "F", "M", "F", "M"],
+    "pri_spec": [
+        "INTERNAL MEDICINE",
+        "ORTHOPEDIC SURGERY",
+        "INTERNAL MEDICINE",
+        "PHYSICAL THERAPY",
+        "CHIROPRACTIC",
+        "PHYSICAL THERAPY",
+    ],
+    "Telephone Number": [
+        "4105550101",
+        "4105550102",
+        "3015550103",
+        "3015550104",
+        "4435550105",
+        "2405550106",
+    ],
+    "Full Address": [
+        "100 N CHARLES ST, BALTIMORE, MD 21201",
+        "201 W PRESTON ST, BALTIMORE, MD 21201",
+        "12500 PARKLAWN DR, ROCKVILLE, MD 20852",
+        "8222 SPADDERDOCK WAY, LAUREL, MD 20724",
+        "1 MARKET PL, BALTIMORE, MD 21202",
+        "8955 EDMONSTON RD, GREENBELT, MD 20770",
+    ],
+    "latitude": [39.2904, 39.2957, 39.0543, 39.0826, 39.2866, 38.9963],
+    "longitude": [-76.6122, -76.6217, -77.1199, -76.8382, -76.6064, -76.8873],
+    "patient_count": [42, 17, 88, 5, 23, 61],
+    "star_value": [4.5, 3.8, 4.9, 4.0, 3.5, 4.2],
+}
+
+
+def create_sample_data(output_path: Path = DEFAULT_OUTPUT_PATH) -> Path:
+    """Write the sample provider table to output_path and return the path."""
+    table = pa.Table.from_pydict(SAMPLE_DATA, schema=SAMPLE_SCHEMA)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    pq.write_table(
+        table,
+        output_path,
+        compression="zstd",
+        compression_level=3,
+        use_dictionary=True,
+    )
+    return output_path
+
+
+def main() -> None:
+    output_path = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_OUTPUT_PATH
+    path = create_sample_data(output_path)
+    print(f"Wrote {len(SAMPLE_DATA['Ind_PAC_ID'])} sample providers to {path}")
+
+
+if __name__ == "__main__":
+    main()
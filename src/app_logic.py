@@ -4,6 +4,12 @@ This module orchestrates the main recommendation workflow, connecting data loadi
 filtering, scoring, and result ranking.
 """
 
+import concurrent.futures
+import math
+import threading
+import time
+
+import numpy as np
 import pandas as pd
 import streamlit as st
 
@@ -20,8 +26,25 @@ from src.utils.providers import (
 )
 from src.utils.scoring import calculate_distances, recommend_provider
 
+# The filter helpers below return views rather than copies; copy-on-write
+# makes that safe on pandas < 3.0 (it is always enabled from 3.0 on)
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+# Arrow-backed storage for the name/address columns: strings live in
+# contiguous Arrow buffers and .str ops dispatch to Arrow kernels. pandas 3
+# already does this for "string", but on older pandas that dtype means
+# per-cell Python objects, so request pyarrow storage explicitly
+try:
+    import pyarrow  # noqa: F401
+
+    _STRING_DTYPE = "string[pyarrow]"
+except ImportError:  # pragma: no cover - pyarrow is a hard requirement
+    _STRING_DTYPE = "string"
+
 __all__ = [
     "load_application_data",
+    "load_search_options",
     "apply_time_filtering",
     "filter_providers_by_radius",
     "get_unique_specialties",
@@ -33,6 +56,19 @@ __all__ = [
 ]
 
 
+def _coord_unit_vectors(lat_deg, lon_deg) -> np.ndarray:
+    """Map degree coordinates to 3D unit-sphere vectors.
+
+    Chord distance between unit vectors is a monotonic, exact proxy for
+    great-circle distance (chord = 2·sin(angle/2)), which lets a Euclidean
+    KD-tree answer haversine radius queries.
+    """
+    lat = np.radians(np.asarray(lat_deg, dtype=float))
+    lon = np.radians(np.asarray(lon_deg, dtype=float))
+    cos_lat = np.cos(lat)
+    return np.column_stack((cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)))
+
+
 def _clean_provider_addresses(provider_df: pd.DataFrame) -> pd.DataFrame:
     """Clean and standardize provider address data.
 
@@ -44,28 +80,35 @@ def _clean_provider_addresses(provider_df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pd.DataFrame: Provider DataFrame with cleaned address data
     """
-    # Clean address field values
-    for col in ["Street", "City", "State", "Zip", "Full Address"]:
-        if col in provider_df.columns:
-            provider_df[col] = provider_df[col].astype(str).replace(["nan", "None", "NaN"], "").fillna("")
+    # Clean address field values in one batched pass over the subset
+    addr_cols = [c for c in ["Street", "City", "State", "Zip", "Full Address"] if c in provider_df.columns]
+    if addr_cols:
+        provider_df[addr_cols] = (
+            provider_df[addr_cols]
+            .astype(_STRING_DTYPE)
+            .replace({"nan": "", "None": "", "NaN": ""})
+            .fillna("")
+        )
 
     # Build full address if missing or incomplete
     if "Full Address" not in provider_df.columns or provider_df["Full Address"].isna().any():
         provider_df = build_full_address(provider_df)
 
-    # Remove duplicate providers by name
+    # Remove duplicate providers by name. Factorizing to category codes
+    # hashes each name once; the duplicate scan then runs on integer codes
     if "Full Name" in provider_df.columns:
-        provider_df = provider_df.drop_duplicates(subset=["Full Name"], keep="first")
+        name_codes = provider_df["Full Name"].astype("category").cat.codes
+        provider_df = provider_df[~name_codes.duplicated()]
 
     # Standardize phone number formatting
     phone_candidates = [
         col for col in ["Work Phone Number", "Work Phone", "Phone Number", "Phone 1"] if col in provider_df.columns
     ]
     if phone_candidates:
-        from src.utils.io_utils import format_phone_number
+        from src.utils.io_utils import format_phone_column
 
         phone_source = phone_candidates[0]
-        provider_df["Work Phone Number"] = provider_df[phone_source].apply(format_phone_number)
+        provider_df["Work Phone Number"] = format_phone_column(provider_df[phone_source])
         if "Work Phone" not in provider_df.columns:
             provider_df["Work Phone"] = provider_df["Work Phone Number"]
         if "Phone Number" not in provider_df.columns:
@@ -89,17 +132,41 @@ def _ensure_client_counts(provider_df: pd.DataFrame) -> pd.DataFrame:
     else:
         provider_df["Client Count"] = 0
 
+    # int32 halves the bytes streamed by the min-clients mask and scoring
+    provider_df["Client Count"] = provider_df["Client Count"].astype("int32")
+
     return provider_df
 
 
-@st.cache_data(ttl=3600)
+# Fixed pivot for triangle-inequality distance pruning (central Maryland,
+# near the middle of the provider service area). Any fixed point works; the
+# prune only requires that provider and query distances use the same pivot.
+_PIVOT_LAT = 39.0458
+_PIVOT_LON = -76.6413
+
+# Single-flight guard for load_application_data. When the cached entry
+# expires with several sessions active, every session misses at once and would
+# otherwise reload the full Parquet in parallel (thundering herd). The lock
+# serializes the misses and the memo lets waiters reuse the winner's result
+# instead of repeating the load.
+_LOAD_TTL_SECONDS = 3600
+_LOAD_LOCK = threading.Lock()
+_LAST_LOAD: tuple | None = None  # (monotonic timestamp, provider_df, detailed_referrals_df)
+_LOAD_GENERATION = 0  # bumped per real load; stamps frames for downstream memo keys
+
+
+@st.cache_resource(ttl=_LOAD_TTL_SECONDS)
 def load_application_data():
     """Load and enrich provider and referral data for the application.
 
-    This function is the primary data loader for the app, performing:
-    1. Provider data loading and validation
-    2. Coordinate and address cleaning
-    3. Client count validation
+    Cached with a 1-hour TTL. Concurrent cache misses are single-flighted:
+    one session performs the load while the rest wait and reuse its result.
+
+    Cached via st.cache_resource, so hits return the shared frames directly
+    instead of pickling a fresh copy per call (cache_data's per-hit
+    serialization dominates load time for frames this size). Callers must
+    treat the returned frames as read-only — the mutating consumers
+    (run_recommendation, apply_time_filtering) already operate on copies.
 
     Returns:
         Tuple[pd.DataFrame, pd.DataFrame]: (provider_df, detailed_referrals_df)
@@ -109,38 +176,191 @@ def load_application_data():
     Raises:
         Exception: If data loading fails completely (caught by calling code)
     """
+    global _LAST_LOAD
+    with _LOAD_LOCK:
+        if _LAST_LOAD is not None and time.monotonic() - _LAST_LOAD[0] < _LOAD_TTL_SECONDS:
+            # Another session finished the load while we waited on the lock
+            return _LAST_LOAD[1], _LAST_LOAD[2]
+        provider_df, detailed_referrals_df = _load_application_data()
+        _LAST_LOAD = (time.monotonic(), provider_df, detailed_referrals_df)
+        return provider_df, detailed_referrals_df
+
+
+def invalidate_load_memo() -> None:
+    """Drop the single-flight load memo.
+
+    Called by refresh_data_cache() alongside the Streamlit cache clears —
+    without this, a forced refresh would still serve the pre-refresh frames
+    to any session re-entering the cleared wrapper within the TTL.
+    """
+    global _LAST_LOAD
+    with _LOAD_LOCK:
+        _LAST_LOAD = None
+
+
+def _load_application_data():
+    """Perform the actual provider and referral data load.
+
+    This function is the primary data loader for the app, performing:
+    1. Provider data loading and validation
+    2. Coordinate and address cleaning
+    3. Client count validation
+    """
     import logging
 
     logger = logging.getLogger(__name__)
 
-    # Load and validate base provider data
-    provider_df = load_and_validate_provider_data()
+    # Kick off the referral load in a worker thread so it overlaps the
+    # provider load and cleaning below — the two reads are independent and
+    # pyarrow releases the GIL during parquet decode
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+        referrals_future = pool.submit(load_detailed_referrals)
+
+        # Load and validate base provider data
+        provider_df = load_and_validate_provider_data()
+
+        if provider_df.empty:
+            logger.warning("load_and_validate_provider_data() returned empty DataFrame, trying fallback loader")
+            try:
+                from src.data.ingestion import load_provider_data as _fallback_loader
+
+                provider_df = _fallback_loader()
+                logger.info(f"Fallback loader returned {len(provider_df)} providers")
+            except Exception as e:
+                logger.error(f"Fallback loader failed: {type(e).__name__}: {e}")
+                raise
+
+        # Clean and enrich the provider data, keyed on a content fingerprint
+        # so a TTL rollover whose re-read returns identical data reuses the
+        # already-enriched frame instead of re-running the cleaning passes.
+        # An unhashable frame gets a unique key, which degrades gracefully
+        # to enriching on every load
+        if not provider_df.empty:
+            try:
+                fingerprint = str(pd.util.hash_pandas_object(provider_df, index=False).sum())
+            except TypeError:
+                fingerprint = str(time.monotonic())
+            provider_df = _enrich_provider_data(fingerprint, provider_df)
+
+        # Join the referral load
+        detailed_referrals_df = referrals_future.result()
+
+    # Stamp the referral frame with a per-load generation so downstream
+    # memos (_cached_time_counts) can key on it instead of the frame's
+    # transient object identity
+    global _LOAD_GENERATION
+    _LOAD_GENERATION += 1
+    detailed_referrals_df.attrs["load_generation"] = _LOAD_GENERATION
 
-    if provider_df.empty:
-        logger.warning("load_and_validate_provider_data() returned empty DataFrame, trying fallback loader")
-        try:
-            from src.data.ingestion import load_provider_data as _fallback_loader
+    return provider_df, detailed_referrals_df
+
+
+@st.cache_resource(show_spinner=False)
+def _enrich_provider_data(fingerprint: str, _provider_df: pd.DataFrame) -> pd.DataFrame:
+    """Run the cleaning and enrichment passes over freshly loaded provider data.
 
-            provider_df = _fallback_loader()
-            logger.info(f"Fallback loader returned {len(provider_df)} providers")
-        except Exception as e:
-            logger.error(f"Fallback loader failed: {type(e).__name__}: {e}")
-            raise
+    Cached on the caller-supplied content fingerprint (the frame itself is
+    skipped by the hasher via the underscore prefix), so the cleaning cost
+    is paid once per dataset version rather than once per cache window.
+
+    Args:
+        fingerprint: Content hash of the raw provider frame
+        _provider_df: Raw provider DataFrame as loaded from storage
+
+    Returns:
+        pd.DataFrame: Cleaned and enriched provider data
+    """
+    import logging
+
+    logger = logging.getLogger(__name__)
+    provider_df = _provider_df
 
     # Clean and standardize provider data
-    if not provider_df.empty:
-        provider_df = validate_and_clean_coordinates(provider_df)
-        provider_df = clean_address_data(provider_df)
-        provider_df = _clean_provider_addresses(provider_df)
+    provider_df = validate_and_clean_coordinates(provider_df)
+    provider_df = clean_address_data(provider_df)
+    provider_df = _clean_provider_addresses(provider_df)
 
-    # Load referral data
-    detailed_referrals_df = load_detailed_referrals()
+    # float32 coordinates halve what the distance kernels stream;
+    # ~1e-5 degree precision is far finer than needed for miles
+    for col in ("Latitude", "Longitude"):
+        if col in provider_df.columns:
+            provider_df[col] = pd.to_numeric(provider_df[col], errors="coerce").astype("float32")
 
     # Enrich provider data with client counts
-    if not provider_df.empty:
-        provider_df = _ensure_client_counts(provider_df)
+    provider_df = _ensure_client_counts(provider_df)
 
-    return provider_df, detailed_referrals_df
+    # Compact dtypes for the hot filter/lookup keys: Gender compares as
+    # integer category codes, Full Name map/dedup runs on pandas string
+    # storage instead of per-row Python objects
+    if "Gender" in provider_df.columns and not isinstance(provider_df["Gender"].dtype, pd.CategoricalDtype):
+        provider_df["Gender"] = provider_df["Gender"].astype("category")
+    if "Full Name" in provider_df.columns:
+        provider_df["Full Name"] = provider_df["Full Name"].astype(_STRING_DTYPE)
+
+    # Precompute each provider's distance to a fixed pivot and sort by
+    # it, so run_recommendation can binary-search the band of providers
+    # that could possibly be within the search radius
+    if {"Latitude", "Longitude"}.issubset(provider_df.columns):
+        try:
+            provider_df["_pivot_dist"] = calculate_distances(_PIVOT_LAT, _PIVOT_LON, provider_df)
+            provider_df = provider_df.sort_values("_pivot_dist", ignore_index=True)
+        except Exception:
+            logger.warning("Could not precompute pivot distances", exc_info=True)
+
+        # KD-tree over unit-sphere coordinates for O(log N) radius queries
+        # in run_recommendation; stored with the index labels of the rows
+        # it covers so tree hits can be mapped back to frame rows
+        try:
+            from scipy.spatial import cKDTree
+
+            coords_ok = provider_df["Latitude"].notna() & provider_df["Longitude"].notna()
+            if coords_ok.any():
+                vectors = _coord_unit_vectors(
+                    provider_df.loc[coords_ok, "Latitude"].to_numpy(dtype=float),
+                    provider_df.loc[coords_ok, "Longitude"].to_numpy(dtype=float),
+                )
+                provider_df.attrs["coord_kdtree"] = (
+                    cKDTree(vectors),
+                    provider_df.index[coords_ok].to_numpy(),
+                )
+        except Exception:
+            logger.warning("Could not build coordinate KD-tree", exc_info=True)
+
+    # Client counts sorted once (descending) alongside their row labels;
+    # the min-clients filter can then binary-search the cutoff instead of
+    # comparing every row on each query. The frame itself stays sorted by
+    # _pivot_dist, which the radius prune depends on
+    if "Client Count" in provider_df.columns:
+        order = provider_df["Client Count"].to_numpy().argsort()[::-1]
+        provider_df.attrs["client_count_order"] = (
+            provider_df["Client Count"].to_numpy()[order],
+            provider_df.index.to_numpy()[order],
+        )
+
+    # Parse the comma-separated Specialty column once per load; the
+    # per-query specialty filter reuses the exploded values instead of
+    # re-splitting the column on every slider movement
+    if "Specialty" in provider_df.columns:
+        provider_df.attrs["specialty_parts"] = _split_specialties(provider_df["Specialty"])
+
+    # Precompute the sidebar option lists once per load; the getters
+    # return these from attrs instead of rescanning the columns
+    provider_df.attrs["unique_specialties"] = get_unique_specialties(provider_df)
+    provider_df.attrs["unique_genders"] = get_unique_genders(provider_df)
+
+    return provider_df
+
+
+@st.cache_data(ttl=_LOAD_TTL_SECONDS)
+def load_search_options() -> tuple[list[str], list[str]]:
+    """Return cached (specialty_options, gender_options) for search widgets.
+
+    Both option lists require a full scan of the provider frame; computing
+    them once per cache window keeps that scan off the per-rerun path of
+    the search page.
+    """
+    provider_df, _ = load_application_data()
+    return get_unique_specialties(provider_df), get_unique_genders(provider_df)
 
 
 def apply_time_filtering(provider_df, detailed_referrals_df, start_date, end_date):
@@ -160,15 +380,48 @@ def apply_time_filtering(provider_df, detailed_referrals_df, start_date, end_dat
     """
     working_df = provider_df.copy()
     if not detailed_referrals_df.empty:
-        time_filtered_outbound = calculate_time_based_referral_counts(detailed_referrals_df, start_date, end_date)
+        generation = detailed_referrals_df.attrs.get("load_generation")
+        if generation is not None:
+            time_filtered_outbound = _cached_time_counts(generation, detailed_referrals_df, start_date, end_date)
+        else:
+            # Ad-hoc frames (tests, direct callers) carry no generation
+            # stamp; aggregate directly rather than risk a cross-frame hit
+            time_filtered_outbound = calculate_time_based_referral_counts(
+                detailed_referrals_df, start_date, end_date
+            )
         if not time_filtered_outbound.empty:
-            working_df = working_df.drop(columns=["Client Count"], errors="ignore").merge(
-                time_filtered_outbound[["Full Name", "Client Count"]], on="Full Name", how="left"
+            # Attach the one recalculated column by key with map() — much
+            # cheaper than a left merge, and no intermediate joined frame.
+            # Counts are aggregated per name; keep="first" guards against
+            # malformed duplicates, which map() would otherwise reject
+            lookup = (
+                time_filtered_outbound.drop_duplicates(subset=["Full Name"], keep="first")
+                .set_index("Full Name")["Client Count"]
+            )
+            working_df["Client Count"] = (
+                working_df["Full Name"].map(lookup).fillna(0).astype("int64")
             )
-            working_df["Client Count"] = working_df["Client Count"].fillna(0)
+            # The precomputed descending-count order (attrs survive copy())
+            # was built from the full-time counts and would feed the
+            # min-clients shortcut stale data — drop it so run_recommendation
+            # falls back to masking the live column
+            working_df.attrs.pop("client_count_order", None)
     return working_df
 
 
+@st.cache_data(ttl=_LOAD_TTL_SECONDS)
+def _cached_time_counts(generation, _detailed_referrals_df, start_date, end_date):
+    """Memoized time-based referral aggregation.
+
+    Keyed on the date range plus the loader's generation stamp (the frame
+    itself is skipped by the hasher via the underscore prefix) — object
+    identity is not a safe key, since CPython can reuse a freed frame's id
+    after a reload. Re-picking the same range returns the aggregate without
+    re-running the groupby.
+    """
+    return calculate_time_based_referral_counts(_detailed_referrals_df, start_date, end_date)
+
+
 def filter_providers_by_radius(df: pd.DataFrame, max_radius_miles: float) -> pd.DataFrame:
     """Filter providers by maximum radius distance.
 
@@ -184,7 +437,7 @@ def filter_providers_by_radius(df: pd.DataFrame, max_radius_miles: float) -> pd.
     # Special case: 0 means no radius filter, return all providers
     if max_radius_miles == 0:
         return df
-    return df[df["Distance (Miles)"] <= max_radius_miles].copy()
+    return df[df["Distance (Miles)"] <= max_radius_miles]
 
 
 def get_unique_specialties(provider_df: pd.DataFrame) -> list[str]:
@@ -201,21 +454,30 @@ def get_unique_specialties(provider_df: pd.DataFrame) -> list[str]:
     if provider_df.empty or "Specialty" not in provider_df.columns:
         return []
 
+    # _load_application_data precomputes the option list once per load and
+    # stashes it on the frame; reruns get it without rescanning the column
+    cached = provider_df.attrs.get("unique_specialties")
+    if cached is not None:
+        return cached
+
     # Get all non-null specialty values
     specialties_series = provider_df["Specialty"].dropna()
 
     if specialties_series.empty:
         return []
 
-    # Split comma-separated specialties and collect unique values
-    unique_specialties = set()
-    for specialty_str in specialties_series:
-        if pd.notna(specialty_str) and str(specialty_str).strip():
-            # Split by comma and strip whitespace from each specialty
-            parts = [s.strip() for s in str(specialty_str).split(",")]
-            unique_specialties.update(part for part in parts if part)
+    # Only distinct values need splitting: categorical columns expose them
+    # directly, otherwise deduplicate first so the split runs over
+    # O(unique) values instead of O(rows)
+    if isinstance(specialties_series.dtype, pd.CategoricalDtype):
+        distinct_values = pd.Series(specialties_series.cat.categories)
+    else:
+        distinct_values = pd.Series(specialties_series.unique())
 
-    return sorted(list(unique_specialties))
+    # Split comma-separated specialties in pandas string kernels rather
+    # than a per-value Python loop
+    parts = distinct_values.astype("string").str.split(",").explode().str.strip().dropna()
+    return sorted(parts[parts != ""].unique().tolist())
 
 
 def get_unique_genders(provider_df: pd.DataFrame) -> list[str]:
@@ -230,21 +492,60 @@ def get_unique_genders(provider_df: pd.DataFrame) -> list[str]:
     if provider_df.empty or "Gender" not in provider_df.columns:
         return []
 
+    # Same attrs memo as get_unique_specialties
+    cached = provider_df.attrs.get("unique_genders")
+    if cached is not None:
+        return cached
+
     # Get all non-null gender values
     genders_series = provider_df["Gender"].dropna()
 
     if genders_series.empty:
         return []
 
-    # Collect unique gender values (standardize to title case)
-    unique_genders = set()
-    for gender_str in genders_series:
-        if pd.notna(gender_str) and str(gender_str).strip():
-            gender_clean = str(gender_str).strip().title()
-            if gender_clean:
-                unique_genders.add(gender_clean)
+    # Title-case only the distinct values, not every row
+    if isinstance(genders_series.dtype, pd.CategoricalDtype):
+        distinct_values = pd.Series(genders_series.cat.categories)
+    else:
+        distinct_values = pd.Series(genders_series.unique())
 
-    return sorted(list(unique_genders))
+    # Standardize to title case with vectorized string kernels
+    cleaned = distinct_values.astype("string").str.strip().str.title().dropna()
+    return sorted(cleaned[cleaned != ""].unique().tolist())
+
+
+def _split_specialties(specialty: pd.Series) -> pd.Series:
+    """Explode comma-separated specialties to one stripped value per row,
+    keeping the original index so matches can be collapsed back per row."""
+    return specialty.astype("string").fillna("").str.split(",").explode().str.strip()
+
+
+def _specialty_match_mask(
+    specialty: pd.Series, selected_specialties: list[str], parts: pd.Series = None
+) -> pd.Series:
+    """Boolean mask over `specialty` marking rows whose comma-separated list
+    intersects `selected_specialties`. Aligned with the input index.
+
+    `parts` accepts a pre-split explosion of the column (see
+    _split_specialties); without it the split runs here, per call.
+    """
+    if parts is None:
+        parts = _split_specialties(specialty)
+    # Test membership on the exploded values, then collapse back to a
+    # per-row any() mask — no Python callback per row
+    return (
+        parts.isin(set(selected_specialties))
+        .groupby(level=0)
+        .any()
+        .reindex(specialty.index, fill_value=False)
+    )
+
+
+def _gender_match_mask(gender: pd.Series, selected_genders: list[str]) -> pd.Series:
+    """Boolean mask over `gender` marking rows matching `selected_genders`
+    after title-case standardization. Aligned with the input index."""
+    mask = gender.astype("string").str.strip().str.title().isin(set(selected_genders))
+    return mask.fillna(False).astype(bool)
 
 
 def filter_providers_by_specialty(df: pd.DataFrame, selected_specialties: list[str]) -> pd.DataFrame:
@@ -267,19 +568,7 @@ def filter_providers_by_specialty(df: pd.DataFrame, selected_specialties: list[s
     if not selected_specialties or "Specialty" not in df.columns:
         return df
 
-    # Create a boolean mask for providers that match any selected specialty
-    def matches_specialty(specialty_value):
-        if pd.isna(specialty_value):
-            return False
-
-        # Split comma-separated specialties
-        provider_specialties = [s.strip() for s in str(specialty_value).split(",")]
-
-        # Check if any provider specialty matches any selected specialty
-        return any(ps in selected_specialties for ps in provider_specialties if ps)
-
-    mask = df["Specialty"].apply(matches_specialty)
-    return df[mask].copy()
+    return df[_specialty_match_mask(df["Specialty"], selected_specialties)]
 
 
 def filter_providers_by_gender(df: pd.DataFrame, selected_genders: list[str]) -> pd.DataFrame:
@@ -299,17 +588,7 @@ def filter_providers_by_gender(df: pd.DataFrame, selected_genders: list[str]) ->
     if not selected_genders or "Gender" not in df.columns:
         return df
 
-    # Create a boolean mask for providers that match any selected gender
-    def matches_gender(gender_value):
-        if pd.isna(gender_value):
-            return False
-
-        # Standardize to title case for comparison
-        provider_gender = str(gender_value).strip().title()
-        return provider_gender in selected_genders
-
-    mask = df["Gender"].apply(matches_gender)
-    return df[mask].copy()
+    return df[_gender_match_mask(df["Gender"], selected_genders)]
 
 
 def run_recommendation(
@@ -323,6 +602,7 @@ def run_recommendation(
     beta: float,
     selected_specialties: list[str] = None,
     selected_genders: list[str] = None,
+    top_k: int = None,
 ):
     """Run the complete provider recommendation workflow.
 
@@ -345,32 +625,102 @@ def run_recommendation(
         beta: Normalized weight for client count (0-1)
         selected_specialties: Optional list of specialties to filter by
         selected_genders: Optional list of genders to filter by
+        top_k: Optional cap on ranked results; selects the top scores with
+            an O(N) partition before the full multi-key sort
 
     Returns:
         Tuple[Optional[pd.Series], pd.DataFrame]:
             - best: Top-ranked provider (or None if no matches)
             - scored_df: All matching providers with scores (or empty DataFrame)
     """
-    working = provider_df.copy()
+    # The filters propagate a label index rather than intermediate frames:
+    # each step reads only the column(s) it needs and narrows `idx`, and the
+    # surviving rows are materialized exactly once, right before the
+    # distance column is written.
+    #
+    # When min-clients is the only attribute filter, binary-search the
+    # precomputed descending count order instead of comparing every row;
+    # sorting the surviving labels restores frame order so the pivot band
+    # below stays a binary search. The size guard skips the shortcut for
+    # frames that didn't come through the loader unchanged
+    cc_entry = provider_df.attrs.get("client_count_order")
+    if cc_entry is not None and not selected_specialties and not selected_genders:
+        counts_desc, labels_desc = cc_entry
+        if labels_desc.size == provider_df.index.size:
+            cut = int(np.searchsorted(-counts_desc, -min_clients, side="right"))
+            idx = pd.Index(np.sort(labels_desc[:cut]))
+        else:
+            idx = provider_df.index[provider_df["Client Count"] >= min_clients]
+    else:
+        # Otherwise fuse the client-count, specialty, and gender masks into
+        # a single combined mask so the index is narrowed once instead of
+        # once per attribute filter
+        mask = provider_df["Client Count"] >= min_clients
+        if selected_specialties and "Specialty" in provider_df.columns:
+            mask &= _specialty_match_mask(
+                provider_df["Specialty"],
+                selected_specialties,
+                parts=provider_df.attrs.get("specialty_parts"),
+            )
+        if selected_genders and "Gender" in provider_df.columns:
+            mask &= _gender_match_mask(provider_df["Gender"], selected_genders)
+        idx = provider_df.index[mask]
+    if idx.empty:
+        return None, pd.DataFrame()
 
-    # Apply specialty filter first (before other filters)
-    if selected_specialties:
-        working = filter_providers_by_specialty(working, selected_specialties)
-        if working.empty:
+    # KD-tree radius query: O(log N) candidate lookup on the unit sphere,
+    # exact for great-circle radii via the chord-distance mapping. The
+    # linear prunes below serve as the fallback when no tree is attached
+    _tree_entry = provider_df.attrs.get("coord_kdtree") if max_radius_miles else None
+    if _tree_entry is not None:
+        tree, tree_labels = _tree_entry
+        user_vec = _coord_unit_vectors([user_lat], [user_lon])[0]
+        chord = 2.0 * math.sin(min(max_radius_miles / 3958.8, math.pi) / 2.0)
+        hits = tree.query_ball_point(user_vec, r=chord)
+        idx = idx[idx.isin(tree_labels[hits])]
+        if idx.empty:
             return None, pd.DataFrame()
 
-    # Apply gender filter
-    if selected_genders:
-        working = filter_providers_by_gender(working, selected_genders)
-        if working.empty:
+    # Triangle-inequality prune: any provider within the radius must have a
+    # pivot distance within `radius` of the user's own pivot distance. The
+    # frame is loaded sorted by _pivot_dist and index narrowing preserves
+    # order, so the band is usually a binary-search slice
+    if _tree_entry is None and max_radius_miles and "_pivot_dist" in provider_df.columns:
+        d_qp = float(
+            calculate_distances(
+                user_lat,
+                user_lon,
+                pd.DataFrame({"Latitude": [_PIVOT_LAT], "Longitude": [_PIVOT_LON]}),
+            )[0]
+        )
+        lo, hi = d_qp - max_radius_miles, d_qp + max_radius_miles
+        pivot_dist = provider_df.loc[idx, "_pivot_dist"]
+        if pivot_dist.is_monotonic_increasing:
+            start = pivot_dist.searchsorted(lo, side="left")
+            end = pivot_dist.searchsorted(hi, side="right")
+            idx = idx[start:end]
+        else:
+            idx = idx[pivot_dist.between(lo, hi).to_numpy()]
+        if idx.empty:
             return None, pd.DataFrame()
 
-    # Apply client count filter
-    working = working[working["Client Count"] >= min_clients].copy()
-    if working.empty:
-        return None, pd.DataFrame()
+    # Cheap bounding-box prefilter before the trig-heavy haversine: plain
+    # range comparisons prune providers that cannot be inside the radius
+    # (1 degree latitude ≈ 69 miles; longitude shrinks by cos(lat))
+    if _tree_entry is None and max_radius_miles and {"Latitude", "Longitude"}.issubset(provider_df.columns):
+        dlat = max_radius_miles / 69.0
+        dlon = max_radius_miles / (69.0 * max(math.cos(math.radians(user_lat)), 0.01))
+        mask = provider_df.loc[idx, "Latitude"].between(user_lat - dlat, user_lat + dlat) & provider_df.loc[
+            idx, "Longitude"
+        ].between(user_lon - dlon, user_lon + dlon)
+        idx = idx[mask.to_numpy()]
+        if idx.empty:
+            return None, pd.DataFrame()
 
-    # Calculate distances and filter by radius
+    # Calculate distances and filter by radius (single materialization of
+    # what survived the filters, taken here because a column is about to be
+    # written)
+    working = provider_df.loc[idx].copy()
     working["Distance (Miles)"] = calculate_distances(user_lat, user_lon, working)
     working = filter_providers_by_radius(working, max_radius_miles)
     if working.empty:
@@ -383,7 +733,8 @@ def run_recommendation(
         client_weight=beta,
         min_clients=min_clients,
         selected_specialties=selected_specialties if selected_specialties else None,
+        top_k=top_k,
     )
-    if scored_df is not None and not scored_df.empty and "Full Name" in scored_df.columns:
-        scored_df = scored_df.drop_duplicates(subset=["Full Name"], keep="first")
+    # Names are deduplicated at load time (_clean_provider_addresses) and no
+    # step here re-introduces duplicates, so no per-query dedup is needed
     return best, scored_df
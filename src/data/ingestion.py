@@ -77,12 +77,21 @@ Integration Points:
 For more on the overall data flow architecture, see docs/ARCHITECTURE.md.
 """
 
+import functools
+import hashlib
 import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from enum import Enum
 from pathlib import Path
 from typing import Dict, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import streamlit as st
 
 from src.data.io_utils import load_dataframe
@@ -92,6 +101,241 @@ logger = logging.getLogger(__name__)
 
 _DB_PATH = Path("data/processed/medmatch.duckdb")
 
+# Columns the app consumes from Combined_Contacts_and_Reviews.parquet
+# (see _transform_combined_data for the mapping to the standard schema and
+# scoring._specialty_scores for the sec_spec_* usage). Projecting the read
+# to this list skips decoding pipeline-only columns.
+_COMBINED_REQUIRED_COLUMNS = (
+    "Ind_PAC_ID",
+    "Provider First Name",
+    "Provider Last Name",
+    "gndr",
+    "pri_spec",
+    "sec_spec_1",
+    "sec_spec_2",
+    "sec_spec_3",
+    "sec_spec_4",
+    "Telephone Number",
+    "Full Address",
+    "latitude",
+    "longitude",
+    "patient_count",
+    "star_value",
+    "geocode_source",
+    "geocode_verified_at",
+)
+
+# Canonical Arrow types for the combined file. Casting the read table to
+# these pins string (vs large_string) stability across pyarrow versions,
+# dictionary-encodes the low-cardinality label columns at the Arrow level,
+# and compacts the numerics — all before pandas ever sees the data. Columns
+# absent from this map keep whatever type the file declares.
+_COMBINED_ARROW_TYPES = {
+    "Ind_PAC_ID": pa.string(),
+    "Provider First Name": pa.string(),
+    "Provider Last Name": pa.string(),
+    "gndr": pa.dictionary(pa.int8(), pa.string()),
+    "pri_spec": pa.dictionary(pa.int32(), pa.string()),
+    "Telephone Number": pa.string(),
+    "Full Address": pa.string(),
+    "latitude": pa.float64(),
+    "longitude": pa.float64(),
+    "patient_count": pa.int32(),
+    "star_value": pa.float32(),
+}
+
+# Parquet footer metadata cache keyed by path → (st_mtime_ns, FileMetaData).
+# Parsing the footer costs O(schema size) per open; with hourly cache misses
+# and unchanged files the parsed metadata can be reused across reads.
+_PARQUET_META_CACHE: Dict[str, Tuple[int, "pq.FileMetaData"]] = {}
+
+
+def _get_parquet_metadata(file_path: str) -> Optional["pq.FileMetaData"]:
+    """Return parsed parquet metadata for file_path, reusing it while the
+    file's mtime is unchanged. Returns None if the footer can't be read."""
+    try:
+        mtime_ns = Path(file_path).stat().st_mtime_ns
+        cached = _PARQUET_META_CACHE.get(file_path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        metadata = pq.read_metadata(file_path)
+        _PARQUET_META_CACHE[file_path] = (mtime_ns, metadata)
+        return metadata
+    except Exception as e:
+        logger.warning(f"Could not read parquet metadata for {file_path}: {e}")
+        return None
+
+
+# Transformed-frame sidecar cache. Parquet decode + schema transform run on
+# every in-process cache miss (TTL expiry, daily refresh, restart) even when
+# the source file is unchanged. A Feather v2 snapshot of the transformed
+# frame, keyed by the source file's content fingerprint in its name, turns
+# those misses into a near-zero-cost Arrow IPC read.
+_SIDECAR_DIR = ".cache"
+
+
+def _sidecar_path(file_path: str, fingerprint: str) -> Path:
+    """Return the Feather sidecar path for (source file, fingerprint)."""
+    src = Path(file_path)
+    return src.parent / _SIDECAR_DIR / f"{src.stem}.{fingerprint}.feather"
+
+
+def _read_transformed_sidecar(file_path: str, fingerprint: str) -> Optional[pd.DataFrame]:
+    """Load the transformed-frame snapshot for file_path, or None if absent/stale."""
+    path = _sidecar_path(file_path, fingerprint)
+    try:
+        if not path.exists():
+            return None
+        import pyarrow.feather as feather
+
+        df = feather.read_table(path, memory_map=True).to_pandas(types_mapper=pd.ArrowDtype)
+        logger.info(f"Loaded {len(df)} transformed records from sidecar {path.name}")
+        return df
+    except Exception as e:
+        logger.warning(f"Could not read sidecar cache {path}: {e}")
+        return None
+
+
+def _write_transformed_sidecar(df: pd.DataFrame, file_path: str, fingerprint: str) -> None:
+    """Snapshot the transformed frame next to its source; failures only log."""
+    path = _sidecar_path(file_path, fingerprint)
+    try:
+        import pyarrow.feather as feather
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Drop snapshots of older versions of the same source file
+        for stale in path.parent.glob(f"{Path(file_path).stem}.*.feather"):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+        # lz4 over zstd: the snapshot is read on every cold start, so decode
+        # speed matters more than the few extra MB on disk
+        feather.write_feather(df, path, compression="lz4")
+    except Exception as e:
+        logger.warning(f"Could not write sidecar cache {path}: {e}")
+
+
+def _stat_path(path: Union[str, Path]) -> Optional[os.stat_result]:
+    """Stat a file once, covering both existence and mtime.
+
+    Replaces the exists()-then-stat() pattern (two syscalls) with a single
+    os.stat. Results are shared within a one-second bucket, so the several
+    stat checks a single page render triggers collapse into one syscall.
+    """
+    return _stat_path_cached(str(path), int(time.time()))
+
+
+@functools.lru_cache(maxsize=8)
+def _stat_path_cached(path_str: str, second_bucket: int) -> Optional[os.stat_result]:
+    try:
+        return os.stat(path_str)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _fast_fingerprint(path: Union[str, Path]) -> Optional[str]:
+    """Cheap content fingerprint: file size plus a hash of its head and tail.
+
+    Used as the cache key for the parquet loads instead of a raw mtime.
+    A touched-but-identical file (container rebuilds, re-downloads of the
+    same data) re-hashes to the same fingerprint and keeps every cache tier
+    warm, while a real overwrite changes it even within mtime resolution.
+    The hash itself is re-computed only when size or mtime move.
+    """
+    stat_result = _stat_path(path)
+    if stat_result is None:
+        return None
+    return _fingerprint_cached(str(path), stat_result.st_size, stat_result.st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=8)
+def _fingerprint_cached(path_str: str, size: int, mtime_ns: int) -> str:
+    chunk = 64 * 1024
+    digest = hashlib.blake2b(str(size).encode(), digest_size=8)
+    with open(path_str, "rb") as f:
+        digest.update(f.read(chunk))
+        if size > 2 * chunk:
+            f.seek(-chunk, os.SEEK_END)
+        digest.update(f.read(chunk))
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=4)
+def _load_transformed_base(file_path: str, fingerprint: str) -> pd.DataFrame:
+    """Read and transform the combined file once per (path, fingerprint)
+    process-wide.
+
+    Every DataSource routes to the same parquet file, but st.cache_data keys
+    its entries on the source as well, so preload_data would otherwise
+    re-read and re-transform identical bytes once per source. This layer
+    dedupes that work beneath the Streamlit cache. Callers must not mutate
+    the returned frame — source-specific processing copies first.
+    """
+    manager = get_data_manager()
+
+    # Fast path: a Feather snapshot of the already-transformed frame for
+    # this exact source content skips the parquet decode and the transform
+    df = _read_transformed_sidecar(file_path, fingerprint)
+    if df is not None:
+        return manager._categorize_low_cardinality(df)
+
+    # Load parquet file, projecting to the columns the app uses. The file is
+    # memory-mapped when the filesystem allows it, so pages are faulted in on
+    # demand and shared with the OS cache instead of being copied into a
+    # private buffer; pre_buffer coalesces the column reads on the plain-read
+    # fallback and use_threads decodes columns in parallel. The footer
+    # metadata is cached per (path, mtime) to skip re-parsing it.
+    metadata = _get_parquet_metadata(file_path)
+    if metadata is not None:
+        available = set(metadata.schema.to_arrow_schema().names)
+    else:
+        available = set(pq.read_schema(file_path).names)
+    columns = [c for c in _COMBINED_REQUIRED_COLUMNS if c in available]
+    try:
+        source = pa.memory_map(file_path, "r")
+        parquet_file = pq.ParquetFile(source, metadata=metadata)
+    except OSError:
+        parquet_file = pq.ParquetFile(file_path, metadata=metadata, pre_buffer=True)
+    table = parquet_file.read(columns=columns or None, use_threads=True)
+    # Pin the canonical types (see _COMBINED_ARROW_TYPES) so downstream code
+    # never pays cast-on-first-use churn; files that deviate beyond a safe
+    # cast keep their native schema
+    try:
+        cast_schema = pa.schema(
+            [
+                pa.field(name, _COMBINED_ARROW_TYPES.get(name, table.schema.field(name).type))
+                for name in table.schema.names
+            ]
+        )
+        if cast_schema != table.schema:
+            table = table.cast(cast_schema)
+    except Exception as e:
+        logger.warning(f"Could not cast combined table to canonical schema: {e}")
+    # Arrow-backed pandas shares the decoded Arrow buffers instead of
+    # converting to NumPy blocks — zero-copy for numerics and a much
+    # smaller footprint for the string columns
+    df = table.to_pandas(types_mapper=pd.ArrowDtype)
+    logger.info(f"Loaded {len(df)} records from {file_path}")
+
+    # Transform the combined data to match the expected schema
+    df = manager._transform_combined_data(df)
+    _write_transformed_sidecar(df, file_path, fingerprint)
+    return df
+
+
+@functools.lru_cache(maxsize=8)
+def _provider_cleanup_plan(columns: Tuple[str, ...]) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Resolve which cleanup columns exist for a given schema, once per schema.
+
+    Returns (text columns to scrub, numeric columns to coerce) restricted to
+    the columns actually present, so the per-load hot path runs no membership
+    checks.
+    """
+    present = set(columns)
+    text_cols = tuple(c for c in ("Work Address", "Work Phone", "Specialty") if c in present)
+    numeric_cols = tuple(c for c in ("Latitude", "Longitude", "Client Count", "Rating") if c in present)
+    return text_cols, numeric_cols
+
+
 # Flag to ensure preferred providers warnings are logged only once per app session
 _preferred_providers_warning_logged = False
 
@@ -147,12 +391,17 @@ class DataIngestionManager:
         # Automatically loads from local parquet files
     """
 
-    def __init__(self):
-        """
-        Initialize the data ingestion manager.
-        """
-        self.cache_ttl = 3600  # 1 hour cache for optimal performance
-        self.data_dir = Path("data/processed")  # Local data directory
+    # Shared configuration — the manager is a cache_resource singleton (see
+    # get_data_manager), so these live on the class rather than being
+    # recomputed per instantiation
+    cache_ttl = 3600  # 1 hour cache for optimal performance
+    data_dir = Path("data/processed")  # Local data directory
+
+    # Guards the daily refresh check: sessions share one manager, and the
+    # shared date plus the lock keep concurrent sessions from double-clearing
+    # the caches at the 4 AM boundary
+    _refresh_lock = threading.Lock()
+    _last_daily_refresh_date = None
 
     def _get_parquet_file_path(self, source: DataSource) -> Optional[Path]:
         """
@@ -171,7 +420,7 @@ class DataIngestionManager:
         parquet_filename = "Combined_Contacts_and_Reviews.parquet"
         parquet_path = self.data_dir / parquet_filename
 
-        if not parquet_path.exists():
+        if _stat_path(parquet_path) is None:
             logger.warning(f"Parquet file not found: {parquet_path}")
             return None
 
@@ -180,36 +429,35 @@ class DataIngestionManager:
 
     @st.cache_data(ttl=3600, show_spinner=False)
     def _load_and_process_data_cached(
-        _self, source: DataSource, file_path: str, last_modified: float
+        _self, source: DataSource, file_path: str, fingerprint: str
     ) -> pd.DataFrame:
         """
         Load and process data from parquet file with Streamlit caching.
 
         This method is cached based on source, file path, and last modified timestamp.
         The cache automatically invalidates when:
-        - The parquet file is updated (detected via last_modified timestamp)
+        - The parquet file's contents change (detected via the fingerprint)
         - The TTL expires (1 hour)
         - Manual cache refresh is triggered
 
         Args:
             source: Data source to process
             file_path: Path to the parquet file
-            last_modified: File modification timestamp for cache invalidation
+            fingerprint: Content fingerprint of the file for cache invalidation
 
         Returns:
             Processed DataFrame cached in Streamlit's st.cache_data
         """
         try:
-            # Load parquet file
-            df = pd.read_parquet(file_path)
-            logger.info(f"Loaded {len(df)} records from {file_path}")
-
-            # Transform the combined data to match the expected schema
-            df = _self._transform_combined_data(df)
+            # The source-independent read + transform is deduped process-wide
+            # per (path, mtime); the Streamlit layer above only adds the
+            # per-source entries
+            df = _load_transformed_base(file_path, fingerprint)
 
-            # Apply source-specific processing
+            # Apply source-specific processing on a copy — the base frame is
+            # shared across sources
             if source == DataSource.PROVIDER_DATA:
-                df = _self._process_provider_data(df)
+                df = _self._process_provider_data(df.copy())
             # For now, all sources get the same data (all providers)
             # In the future, you could filter by referral_type or other criteria
 
@@ -219,6 +467,20 @@ class DataIngestionManager:
             logger.error(f"Failed to load {source.value} from {file_path}: {str(e)}")
             return pd.DataFrame()
 
+    def _categorize_low_cardinality(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Convert low-cardinality label columns to pandas category dtype.
+
+        Specialty, Gender, and the other label columns repeat a small set of
+        values across thousands of rows; storing them as categories cuts the
+        cached frame's memory and speeds up the filter scans that compare
+        against them. geocode_source is deliberately left alone — the
+        geocoding refresher writes new labels into it cell by cell.
+        """
+        for col in ("Specialty", "Gender", "credential", "state", "referral_type"):
+            if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+                df[col] = df[col].astype("category")
+        return df
+
     def _transform_combined_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Transform the Combined_Contacts_and_Reviews data to match the expected schema.
@@ -231,13 +493,25 @@ class DataIngestionManager:
         Returns:
             Transformed DataFrame with standardized schema
         """
-        df = df.copy()
+        # No upfront copy: the input frame is loader-local and column
+        # assignment never writes through to shared Arrow buffers
 
-        # Create Full Name from first and last name
+        # Create Full Name from first and last name. The Arrow join kernel
+        # builds the joined strings in one pass instead of allocating an
+        # intermediate column per + operand
         if 'Provider First Name' in df.columns and 'Provider Last Name' in df.columns:
-            df['Full Name'] = (df['Provider First Name'].fillna('') + ' ' + 
-                              df['Provider Last Name'].fillna('')).str.strip()
-        
+            first = df['Provider First Name'].fillna('')
+            last = df['Provider Last Name'].fillna('')
+            try:
+                import pyarrow as pa
+                import pyarrow.compute as pc
+
+                full = pc.binary_join_element_wise(pa.array(first), pa.array(last), ' ')
+                df['Full Name'] = pd.array(full, dtype=pd.ArrowDtype(pa.string()))
+            except Exception:
+                df['Full Name'] = first.str.cat(last, sep=' ')
+            df['Full Name'] = df['Full Name'].str.strip()
+
         # Map columns to expected schema
         column_mapping = {
             'Telephone Number': 'Work Phone',
@@ -251,22 +525,32 @@ class DataIngestionManager:
             'gndr': 'Gender',
         }
 
-        for old_col, new_col in column_mapping.items():
-            if old_col in df.columns:
-                df[new_col] = df[old_col]
+        # Renaming is a pointer swap per column — no buffer duplication, and
+        # nothing downstream reads the raw names once the schema is mapped
+        df = df.rename(columns={k: v for k, v in column_mapping.items() if k in df.columns})
 
         # Add referral_type for compatibility (all are treated as providers)
         df['referral_type'] = 'provider'
 
-        # Convert numeric columns
-        if 'Latitude' in df.columns:
-            df['Latitude'] = pd.to_numeric(df['Latitude'], errors='coerce')
-        if 'Longitude' in df.columns:
-            df['Longitude'] = pd.to_numeric(df['Longitude'], errors='coerce')
+        # Low-cardinality labels become int8/int16 codes under the hood,
+        # halving memory and making isin/equality filters integer comparisons
+        df = self._categorize_low_cardinality(df)
+
+        # Convert numeric columns. Parquet usually decodes these as numeric
+        # already, so each conversion runs only when the dtype says it is
+        # actually needed instead of unconditionally rewriting every column
+        for col in ('Latitude', 'Longitude', 'Rating'):
+            if col in df.columns and not pd.api.types.is_numeric_dtype(df[col]):
+                df[col] = pd.to_numeric(df[col], errors='coerce')
         if 'Client Count' in df.columns:
-            df['Client Count'] = pd.to_numeric(df['Client Count'], errors='coerce').fillna(0).astype(int)
-        if 'Rating' in df.columns:
-            df['Rating'] = pd.to_numeric(df['Rating'], errors='coerce')
+            counts = df['Client Count']
+            if not pd.api.types.is_numeric_dtype(counts):
+                counts = pd.to_numeric(counts, errors='coerce')
+            if counts.isna().any():
+                counts = counts.fillna(0)
+            if not pd.api.types.is_integer_dtype(counts):
+                counts = counts.astype(int)
+            df['Client Count'] = counts
 
         logger.info(f"Transformed {len(df)} provider records to standard schema")
         return df
@@ -329,17 +613,17 @@ class DataIngestionManager:
                 df[col] = pd.to_numeric(df[col], errors='coerce')
         if 'Last Verified Date' in df.columns:
             df['Last Verified Date'] = pd.to_datetime(df['Last Verified Date'], errors='coerce')
-        return df
+        return self._categorize_low_cardinality(df)
 
     def _try_load_from_duckdb(self, source: DataSource) -> Optional[pd.DataFrame]:
         """Return a DuckDB-sourced provider DataFrame, or None if unavailable."""
         if source != DataSource.PROVIDER_DATA:
             return None
-        if not _DB_PATH.exists():
+        db_stat = _stat_path(_DB_PATH)
+        if db_stat is None:
             logger.warning(f"DuckDB not found at {_DB_PATH}")
             return None
-        last_modified = _DB_PATH.stat().st_mtime
-        df = self._load_from_duckdb_cached(last_modified)
+        df = self._load_from_duckdb_cached(db_stat.st_mtime)
         if df.empty:
             return None
         return self._transform_duckdb_data(df)
@@ -369,9 +653,14 @@ class DataIngestionManager:
                 logger.error(f"No data available for {source.value}")
                 return pd.DataFrame()
 
-            last_modified = file_path.stat().st_mtime
+            # The fingerprint shares the one-second stat cache with
+            # _get_parquet_file_path and only re-hashes when size/mtime move
+            fingerprint = _fast_fingerprint(file_path)
+            if fingerprint is None:
+                logger.error(f"No data available for {source.value}")
+                return pd.DataFrame()
             return self._load_and_process_data_cached(
-                source, str(file_path), last_modified
+                source, str(file_path), fingerprint
             )
 
         except Exception as e:
@@ -428,9 +717,19 @@ class DataIngestionManager:
         - Contains referral_type column for type identification
         - Has proper data types and formatting
         """
-        # Key indicators of cleaned data
-        cleaned_indicators = {"Full Name", "Work Address", "Work Phone", "Latitude", "Longitude", "referral_type"}
-        return len(cleaned_indicators.intersection(set(df.columns))) >= 4
+        # The verdict is memoized on the frame — this gate runs per source on
+        # every load and the column set never changes after ingestion
+        cached = df.attrs.get("_is_cleaned")
+        if cached is not None:
+            return cached
+
+        # Key indicators of cleaned data. Probing the column Index directly
+        # uses its hash table; no throwaway set of all columns is built
+        cleaned_indicators = ("Full Name", "Work Address", "Work Phone", "Latitude", "Longitude", "referral_type")
+        columns = df.columns
+        result = sum(c in columns for c in cleaned_indicators) >= 4
+        df.attrs["_is_cleaned"] = result
+        return result
 
     def _process_outbound_referrals(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -494,36 +793,43 @@ class DataIngestionManager:
 
         This processes the full dataset and separates inbound/outbound referrals.
         """
-        # For all referrals, we need to process both inbound and outbound in one pass
-        processed_rows = []
-
-        for _, row in df.iterrows():
-            # Process outbound referral if present
-            if pd.notna(row.get("Referred To Full Name")):
-                outbound_row = row.copy()
-                outbound_row["Full Name"] = row.get("Referred To Full Name")
-                outbound_row["Work Phone"] = row.get("Referred To's Work Phone")
-                outbound_row["Work Address"] = row.get("Referred To's Work Address")
-                outbound_row["Latitude"] = row.get("Referred To's Details: Latitude")
-                outbound_row["Longitude"] = row.get("Referred To's Details: Longitude")
-                outbound_row["Last Verified Date"] = row.get("Referred To's Details: Last Verified Date")
-                outbound_row["referral_type"] = "outbound"
-                processed_rows.append(outbound_row)
-
-            # Process inbound referral if present
-            if pd.notna(row.get("Referred From Full Name")):
-                inbound_row = row.copy()
-                inbound_row["Full Name"] = row.get("Referred From Full Name")
-                inbound_row["Work Phone"] = row.get("Referred From's Work Phone")
-                inbound_row["Work Address"] = row.get("Referred From's Work Address")
-                inbound_row["Latitude"] = row.get("Referred From's Details: Latitude")
-                inbound_row["Longitude"] = row.get("Referred From's Details: Longitude")
-                inbound_row["Last Verified Date"] = row.get("Referred From's Details: Last Verified Date")
-                inbound_row["referral_type"] = "inbound"
-                processed_rows.append(inbound_row)
-
-        if processed_rows:
-            df = pd.DataFrame(processed_rows)
+        # Each direction becomes one boolean-masked subset with its columns
+        # mapped onto the standard schema — column-level assignments in
+        # pandas' engine instead of a Python loop boxing a Series per row
+        direction_mappings = {
+            "outbound": {
+                "Referred To Full Name": "Full Name",
+                "Referred To's Work Phone": "Work Phone",
+                "Referred To's Work Address": "Work Address",
+                "Referred To's Details: Latitude": "Latitude",
+                "Referred To's Details: Longitude": "Longitude",
+                "Referred To's Details: Last Verified Date": "Last Verified Date",
+            },
+            "inbound": {
+                "Referred From Full Name": "Full Name",
+                "Referred From's Work Phone": "Work Phone",
+                "Referred From's Work Address": "Work Address",
+                "Referred From's Details: Latitude": "Latitude",
+                "Referred From's Details: Longitude": "Longitude",
+                "Referred From's Details: Last Verified Date": "Last Verified Date",
+            },
+        }
+
+        frames = []
+        for referral_type, column_mapping in direction_mappings.items():
+            name_col = next(iter(column_mapping))
+            if name_col not in df.columns:
+                continue
+            subset = df.loc[df[name_col].notna()].copy()
+            if subset.empty:
+                continue
+            for old_col, new_col in column_mapping.items():
+                subset[new_col] = subset[old_col] if old_col in subset.columns else None
+            subset["referral_type"] = referral_type
+            frames.append(subset)
+
+        if frames:
+            df = pd.concat(frames, ignore_index=True)
             df = self._standardize_dates(df)
 
         return df
@@ -540,30 +846,49 @@ class DataIngestionManager:
 
         # If Client Count already exists and each provider is unique, just clean and return
         if "Client Count" in df.columns:
-            # Remove duplicates if any (keep the one with highest client count)
-            if df["Full Name"].duplicated().any():
+            # Remove duplicates if any (keep the one with highest client
+            # count). is_unique is an O(n) single pass that pandas caches on
+            # the array, so the canonical all-unique file skips the global
+            # sort entirely
+            if not df["Full Name"].is_unique:
                 df = df.sort_values("Client Count", ascending=False).drop_duplicates(
                     subset="Full Name", keep="first"
                 ).reset_index(drop=True)
                 logger.info(f"Deduplicated providers: {len(df)} unique providers")
 
-            # Clean up missing values in text columns
-            text_cols = ["Work Address", "Work Phone", "Specialty"]
-            for col in text_cols:
-                if col in df.columns:
-                    df[col] = df[col].astype(str).replace(["nan", "None", "NaN", ""], "").fillna("")
+            # The column set is fixed per data source, so resolve the
+            # column-presence branches once per schema and reuse the plan on
+            # every subsequent cache miss (partial evaluation of the checks,
+            # not of the data)
+            text_cols, numeric_cols = _provider_cleanup_plan(tuple(df.columns))
 
-            # Ensure numeric columns are properly typed
-            numeric_cols = ["Latitude", "Longitude", "Client Count", "Rating"]
+            # Clean up missing values in text columns. A mask write touches
+            # just the NA/sentinel cells instead of round-tripping every
+            # value through astype(str); category columns hold clean labels
+            # already and are left untouched
+            for col in text_cols:
+                if not isinstance(df[col].dtype, pd.CategoricalDtype):
+                    ser = df[col]
+                    bad = ser.isna() | ser.isin(["nan", "None", "NaN"])
+                    if bad.any():
+                        df[col] = ser.mask(bad, "")
+
+            # Ensure numeric columns are properly typed; already-numeric
+            # columns (the canonical Arrow schema) skip the coercion
             for col in numeric_cols:
-                if col in df.columns:
+                if not pd.api.types.is_numeric_dtype(df[col]):
                     df[col] = pd.to_numeric(df[col], errors="coerce")
 
             # Fill NaN client counts with 0
-            if "Client Count" in df.columns:
-                df["Client Count"] = df["Client Count"].fillna(0).astype(int)
+            df["Client Count"] = df["Client Count"].fillna(0).astype(int)
 
-            return df
+            # Ratings only matter through rank order, so float32 halves the
+            # column for free
+            if "Rating" in df.columns and df["Rating"].dtype != np.float32:
+                df["Rating"] = df["Rating"].astype(np.float32)
+
+            # Text cleanup above goes through astype(str); restore category dtype
+            return self._categorize_low_cardinality(df)
 
         # Fallback: old aggregation logic for legacy data formats
         # This is kept for backward compatibility but won't be used with Combined_Contacts_and_Reviews
@@ -741,15 +1066,14 @@ class DataIngestionManager:
 
         missing_cols = [col for col in required_cols if col not in df.columns]
 
-        # Coordinate validation for provider data
+        # Coordinate validation for provider data. One pass over the raw
+        # float arrays — abs() folds the four range checks into two and no
+        # intermediate boolean Series are allocated
         coord_issues = 0
         if "Latitude" in df.columns and "Longitude" in df.columns:
-            invalid_coords = (
-                pd.notna(df["Latitude"])
-                & pd.notna(df["Longitude"])
-                & ((df["Latitude"] < -90) | (df["Latitude"] > 90) | (df["Longitude"] < -180) | (df["Longitude"] > 180))
-            )
-            coord_issues = invalid_coords.sum()
+            lat = df["Latitude"].to_numpy(dtype=np.float64, na_value=np.nan)
+            lon = df["Longitude"].to_numpy(dtype=np.float64, na_value=np.nan)
+            coord_issues = int(np.sum(~np.isnan(lat) & ~np.isnan(lon) & ((np.abs(lat) > 90) | (np.abs(lon) > 180))))
 
         return {
             "valid": len(missing_cols) == 0,
@@ -785,17 +1109,26 @@ class DataIngestionManager:
             DataSource.PROVIDER_DATA,
         ]
 
+        # Warm the sources concurrently: pandas/PyArrow release the GIL
+        # during parquet decode, so the three loads overlap and the warm-up
+        # cost is max(source_times) rather than their sum
         loaded_sources = []
-        for source in critical_sources:
-            try:
-                df = self.load_data(source, show_status=False)
-                if not df.empty:
-                    loaded_sources.append(source.value)
-                    logger.info(f"Preloaded {source.value}: {len(df)} records")
-                else:
-                    logger.warning(f"Failed to preload {source.value}: empty dataset")
-            except Exception as e:
-                logger.error(f"Failed to preload {source.value}: {e}")
+        with ThreadPoolExecutor(max_workers=len(critical_sources)) as executor:
+            futures = {
+                executor.submit(self.load_data, source, show_status=False): source
+                for source in critical_sources
+            }
+            for future in as_completed(futures):
+                source = futures[future]
+                try:
+                    df = future.result()
+                    if not df.empty:
+                        loaded_sources.append(source.value)
+                        logger.info(f"Preloaded {source.value}: {len(df)} records")
+                    else:
+                        logger.warning(f"Failed to preload {source.value}: empty dataset")
+                except Exception as e:
+                    logger.error(f"Failed to preload {source.value}: {e}")
 
         if loaded_sources:
             logger.info(f"Successfully preloaded data sources: {', '.join(loaded_sources)}")
@@ -813,7 +1146,17 @@ class DataIngestionManager:
         Returns:
             True if cache was refreshed, False otherwise
         """
-        from datetime import datetime, time
+        from datetime import datetime, time as dt_time
+
+        # This runs on every script rerun (every widget click). Remember per
+        # session when the check last ran and skip the datetime/lock work
+        # entirely for a minute — a refresh delayed by under a minute past
+        # 4 AM is indistinguishable from one on time
+        now_mono = time.monotonic()
+        last_check = st.session_state.get("_last_refresh_check_mono")
+        if isinstance(last_check, float) and last_check + 60 > now_mono:
+            return False
+        st.session_state["_last_refresh_check_mono"] = now_mono
 
         # Get current time
         now = datetime.now()
@@ -821,35 +1164,45 @@ class DataIngestionManager:
         today = now.date()
 
         # Check if it's after 4 AM
-        refresh_time = time(4, 0, 0)  # 4:00 AM
+        refresh_time = dt_time(4, 0, 0)  # 4:00 AM
         is_after_refresh_time = current_time >= refresh_time
 
-        # Get the last refresh date from session state or cache
+        # The manager is shared across sessions (cache_resource singleton),
+        # so the last refresh date lives on the class and the check-and-claim
+        # runs under a lock — concurrent sessions hitting the 4 AM boundary
+        # can't double-clear the caches. Session state remains a fallback
+        # record for sessions that predate the shared date.
         last_refresh_key = "last_daily_refresh_date"
-        last_refresh_date = st.session_state.get(last_refresh_key)
-
-        # If no last refresh date or it's a different day and after 4 AM, refresh
-        should_refresh = (last_refresh_date is None or last_refresh_date != today) and is_after_refresh_time
+        cls = DataIngestionManager
+        with cls._refresh_lock:
+            last_refresh_date = cls._last_daily_refresh_date or st.session_state.get(last_refresh_key)
+
+            # If no last refresh date or it's a different day and after 4 AM, refresh
+            should_refresh = (last_refresh_date is None or last_refresh_date != today) and is_after_refresh_time
+            if not should_refresh:
+                logger.debug("Daily cache refresh not needed at this time")
+                return False
+            # Claim today's refresh before releasing the lock
+            cls._last_daily_refresh_date = today
 
-        if should_refresh:
-            logger.info(f"Performing daily cache refresh at {now.strftime('%Y-%m-%d %H:%M:%S')}")
-            try:
-                # Clear the cache to force fresh downloads
-                refresh_data_cache()
+        logger.info(f"Performing daily cache refresh at {now.strftime('%Y-%m-%d %H:%M:%S')}")
+        try:
+            # Clear the cache to force fresh downloads
+            refresh_data_cache()
 
-                # Update the last refresh date
-                st.session_state[last_refresh_key] = today
+            # Update the last refresh date
+            st.session_state[last_refresh_key] = today
 
-                # Preload data again after cache clear
-                self.preload_data()
+            # Preload data again after cache clear
+            self.preload_data()
 
-                logger.info("Daily cache refresh completed successfully")
-                return True
-            except Exception as e:
-                logger.error(f"Failed to perform daily cache refresh: {e}")
-                return False
-        else:
-            logger.debug("Daily cache refresh not needed at this time")
+            logger.info("Daily cache refresh completed successfully")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to perform daily cache refresh: {e}")
+            # Release the claim so a later call can retry today's refresh
+            with cls._refresh_lock:
+                cls._last_daily_refresh_date = last_refresh_date
             return False
 
 
@@ -857,36 +1210,31 @@ class DataIngestionManager:
 # Global Instance and Compatibility Functions
 # ============================================================================
 
-# Lazy-initialized global instance for use throughout the application
-_data_manager: Optional[DataIngestionManager] = None
-
-
+@st.cache_resource
 def get_data_manager() -> DataIngestionManager:
     """
-    Return a singleton DataIngestionManager, creating it on first use.
+    Return the shared DataIngestionManager, creating it on first use.
 
-    This laziness avoids import-time side-effects and makes module
-    imports safer for long-running processes (like Streamlit) that
-    may reload modules during development.
+    Registered with st.cache_resource so a single instance is reused
+    across sessions and reruns instead of being re-instantiated at each
+    call site; refresh_data_cache() drops it along with the rest of the
+    resource cache. The laziness also avoids import-time side-effects.
     """
-    global _data_manager
-    if _data_manager is None:
-        _data_manager = DataIngestionManager()
-    return _data_manager
-
-
-# Backwards-compatible module-level symbol for older imports. This proxy
-# delegates attribute access to the lazily-created DataIngestionManager
-# instance so 'from src.data.ingestion import data_manager' continues to work
-# without reintroducing eager instantiation side-effects.
-class _DataManagerProxy:
-    def __getattr__(self, name: str):
-        manager = get_data_manager()
-        return getattr(manager, name)
+    return DataIngestionManager()
 
 
-# Exported symbol (keeps older import paths working)
-data_manager = _DataManagerProxy()
+# Backwards-compatible module-level symbol for older imports. PEP 562
+# resolves 'data_manager' lazily on first access and then binds the real
+# manager into the module dict, so later accesses are plain attribute
+# lookups with no proxy dispatch in between. The manager keeps its state
+# at class level, so holding onto one resolved instance is safe across
+# cache refreshes.
+def __getattr__(name: str):
+    if name == "data_manager":
+        manager = get_data_manager()
+        globals()["data_manager"] = manager
+        return manager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # ============================================================================
@@ -897,13 +1245,13 @@ data_manager = _DataManagerProxy()
 # ============================================================================
 
 
-@st.cache_data(ttl=3600, show_spinner=False)
 def load_detailed_referrals(filepath: Optional[str] = None) -> pd.DataFrame:
     """
     Load detailed referral data (outbound referrals) from local parquet files into Streamlit cache.
 
-    Loads from local parquet file, processes it, and caches
-    the result in st.cache_data for fast subsequent access.
+    Loads from local parquet file and processes it. Caching happens inside
+    the manager's load_data, so this thin wrapper adds no second cache layer
+    (and no extra hash/pickle round-trip of the returned frame).
 
     Maintained for backward compatibility. New code should use:
     data_manager.load_data(DataSource.OUTBOUND_REFERRALS)
@@ -912,18 +1260,18 @@ def load_detailed_referrals(filepath: Optional[str] = None) -> pd.DataFrame:
         filepath: Ignored - automatic file selection from local parquet is used
 
     Returns:
-        DataFrame with outbound referral data cached in st.cache_data
+        DataFrame with outbound referral data (cached by the manager)
     """
     return get_data_manager().load_data(DataSource.OUTBOUND_REFERRALS, show_status=False)
 
 
-@st.cache_data(ttl=3600, show_spinner=False)
 def load_inbound_referrals(filepath: Optional[str] = None) -> pd.DataFrame:
     """
     Load inbound referral data from local parquet files into Streamlit cache.
 
-    Loads from local parquet file, processes it, and caches
-    the result in st.cache_data for fast subsequent access.
+    Loads from local parquet file and processes it. Caching happens inside
+    the manager's load_data, so this thin wrapper adds no second cache layer
+    (and no extra hash/pickle round-trip of the returned frame).
 
     Maintained for backward compatibility. New code should use:
     data_manager.load_data(DataSource.INBOUND_REFERRALS)
@@ -932,18 +1280,18 @@ def load_inbound_referrals(filepath: Optional[str] = None) -> pd.DataFrame:
         filepath: Ignored - automatic file selection from local parquet is used
 
     Returns:
-        DataFrame with inbound referral data cached in st.cache_data
+        DataFrame with inbound referral data (cached by the manager)
     """
     return get_data_manager().load_data(DataSource.INBOUND_REFERRALS, show_status=False)
 
 
-@st.cache_data(ttl=3600, show_spinner=False)
 def load_provider_data(filepath: Optional[str] = None) -> pd.DataFrame:
     """
     Load provider data with client counts from local parquet files into Streamlit cache.
 
-    Loads from local parquet file, aggregates provider data,
-    and caches the result in st.cache_data for fast subsequent access.
+    Loads from local parquet file and aggregates provider data. Caching
+    happens inside the manager's load_data, so this thin wrapper adds no
+    second cache layer.
 
     Maintained for backward compatibility. New code should use:
     data_manager.load_data(DataSource.PROVIDER_DATA)
@@ -952,18 +1300,18 @@ def load_provider_data(filepath: Optional[str] = None) -> pd.DataFrame:
         filepath: Ignored - automatic file selection from local parquet is used
 
     Returns:
-        DataFrame with unique providers and client counts cached in st.cache_data
+        DataFrame with unique providers and client counts (cached by the manager)
     """
     return get_data_manager().load_data(DataSource.PROVIDER_DATA, show_status=False)
 
 
-@st.cache_data(ttl=3600, show_spinner=False)
 def load_all_referrals(filepath: Optional[str] = None) -> pd.DataFrame:
     """
     Load combined referral data (inbound + outbound) from local parquet files into Streamlit cache.
 
-    Loads from local parquet file, processes both inbound and
-    outbound referrals, and caches the combined result in st.cache_data.
+    Loads from local parquet file and processes both inbound and outbound
+    referrals. Caching happens inside the manager's load_data, so this thin
+    wrapper adds no second cache layer.
 
     New function providing access to the combined dataset.
 
@@ -971,24 +1319,24 @@ def load_all_referrals(filepath: Optional[str] = None) -> pd.DataFrame:
         filepath: Ignored - automatic file selection from local parquet is used
 
     Returns:
-        DataFrame with all referral data combined, cached in st.cache_data
+        DataFrame with all referral data combined (cached by the manager)
     """
     return get_data_manager().load_data(DataSource.ALL_REFERRALS, show_status=False)
 
 
-@st.cache_data(ttl=3600, show_spinner=False)
 def load_preferred_providers(filepath: Optional[str] = None) -> pd.DataFrame:
     """
     Load preferred providers contact data from local parquet files into Streamlit cache.
 
-    Loads from local parquet file, processes contact information,
-    and caches the result in st.cache_data for fast subsequent access.
+    Loads from local parquet file and processes contact information.
+    Caching happens inside the manager's load_data, so this thin wrapper
+    adds no second cache layer.
 
     Args:
         filepath: Ignored - automatic file selection from local parquet is used
 
     Returns:
-        DataFrame with preferred provider contact information cached in st.cache_data
+        DataFrame with preferred provider contact information (cached by the manager)
     """
     return get_data_manager().load_data(DataSource.PREFERRED_PROVIDERS, show_status=False)
 
@@ -1038,6 +1386,18 @@ def refresh_data_cache():
         st.cache_resource.clear()
     except Exception:
         pass
+    # Drop the process-wide transformed-frame layer too, so a forced refresh
+    # really re-reads the bytes
+    _load_transformed_base.cache_clear()
+    # The app-logic load path keeps its own single-flight memo; clear it as
+    # well or the refreshed caches would be repopulated from stale frames.
+    # Imported lazily — app_logic imports this module at load time.
+    try:
+        from src.app_logic import invalidate_load_memo
+
+        invalidate_load_memo()
+    except Exception:
+        pass
     logger.info("Data cache cleared - next loads will fetch fresh data from local parquet files")
 
 
@@ -1048,15 +1408,21 @@ def validate_all_data_sources() -> Dict[str, Dict[str, Union[bool, str, int, flo
     Returns:
         Validation results for each data source
     """
+    # Each check is parquet I/O plus GIL-releasing pandas reductions, so
+    # fanning the sources out across threads makes the total roughly the
+    # slowest source instead of the sum of all five
+    manager = get_data_manager()
     results = {}
-    for source in DataSource:
-        try:
-            results[source.value] = get_data_manager().validate_data_integrity(source)
-        except Exception as e:
-            results[source.value] = {
-                "valid": False,
-                "error": str(e),
-                "row_count": 0,
-                "column_count": 0,
-            }
+    with ThreadPoolExecutor(max_workers=len(DataSource)) as executor:
+        futures = {source: executor.submit(manager.validate_data_integrity, source) for source in DataSource}
+        for source, future in futures.items():
+            try:
+                results[source.value] = future.result()
+            except Exception as e:
+                results[source.value] = {
+                    "valid": False,
+                    "error": str(e),
+                    "row_count": 0,
+                    "column_count": 0,
+                }
     return results
@@ -6,6 +6,7 @@ Re-export stable helper functions from the canonical utilities module.
 # warnings are expected for re-exported names and are silenced locally.
 # flake8: noqa: F401
 
+from .addressing import canonical_address  # noqa: F401 (re-exported API)
 from .addressing import validate_coordinates  # noqa: F401 (re-exported API)
 from .addressing import validate_phone_number  # noqa: F401 (re-exported API)
 from .addressing import validate_address, validate_address_input
@@ -31,6 +32,7 @@ from .scoring import calculate_distances, recommend_provider
 __all__ = [
     # From consolidated_functions
     "build_full_address",
+    "canonical_address",
     "calculate_distances",
     "clean_address_data",
     "geocode_address",
@@ -1,7 +1,29 @@
 """Address and coordinate validation helpers."""
+import functools
 import re
 from typing import Tuple
 
+_VALID_STATE_ABBREVS = frozenset({
+    "AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA",
+    "HI", "ID", "IL", "IN", "IA", "KS", "KY", "LA", "ME", "MD",
+    "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV", "NH", "NJ",
+    "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI", "SC",
+    "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY",
+    "DC",
+})
+
+
+def canonical_address(street: str, city: str, state: str, zipcode: str) -> str:
+    """Assemble address parts into a single normalized string.
+
+    Strips each part, uppercases the state, and joins only the non-empty
+    pieces, so equivalent inputs with different whitespace or case produce
+    the same string. Used both for display and as the geocode cache key.
+    """
+    state_zip = f"{state.strip().upper()} {zipcode.strip()}".strip()
+    parts = (street.strip(), city.strip(), state_zip)
+    return ", ".join(p for p in parts if p)
+
 
 def validate_address(address: str) -> Tuple[bool, str]:
     if not address or not address.strip():
@@ -22,7 +44,11 @@ def validate_address(address: str) -> Tuple[bool, str]:
     return True, ""
 
 
+@functools.lru_cache(maxsize=256)
 def validate_address_input(street: str, city: str, state: str, zipcode: str) -> Tuple[bool, str]:
+    """Validate address form fields. Pure function of its four string
+    arguments, so results are memoized — Streamlit reruns re-invoke it with
+    unchanged inputs whenever the user tweaks unrelated widgets."""
     errors = []
     warnings = []
 
@@ -35,60 +61,7 @@ def validate_address_input(street: str, city: str, state: str, zipcode: str) ->
 
     if state and state.strip():
         state_clean = state.strip().upper()
-        valid_states = {
-            "AL",
-            "AK",
-            "AZ",
-            "AR",
-            "CA",
-            "CO",
-            "CT",
-            "DE",
-            "FL",
-            "GA",
-            "HI",
-            "ID",
-            "IL",
-            "IN",
-            "IA",
-            "KS",
-            "KY",
-            "LA",
-            "ME",
-            "MD",
-            "MA",
-            "MI",
-            "MN",
-            "MS",
-            "MO",
-            "MT",
-            "NE",
-            "NV",
-            "NH",
-            "NJ",
-            "NM",
-            "NY",
-            "NC",
-            "ND",
-            "OH",
-            "OK",
-            "OR",
-            "PA",
-            "RI",
-            "SC",
-            "SD",
-            "TN",
-            "TX",
-            "UT",
-            "VT",
-            "VA",
-            "WA",
-            "WV",
-            "WI",
-            "WY",
-            "DC",
-        }
-        if len(state_clean) == 2 and state_clean not in valid_states:
+        if len(state_clean) == 2 and state_clean not in _VALID_STATE_ABBREVS:
             warnings.append(f"'{state}' may not be a valid US state abbreviation")
         elif len(state_clean) > 2:
             warnings.append("Consider using 2-letter state abbreviation (e.g., 'MD' instead of 'Maryland')")
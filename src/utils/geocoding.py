@@ -1,5 +1,8 @@
 """Geocoding helpers with caching and rate limiting."""
+import json
 import re
+import time
+from pathlib import Path
 from typing import Any, Optional, Tuple
 
 import pandas as pd
@@ -11,6 +14,49 @@ from geopy.geocoders import Nominatim
 # Cached factory
 _RATE_LIMITED_GEOCODER = None
 
+# Persistent address→coordinate cache so repeat lookups survive process
+# restarts and skip Nominatim (and its 1 req/sec rate limit) entirely.
+# Entries expire after 30 days; format mirrors the pipeline's
+# data/processed/geocode_cache.json.
+_DISK_CACHE_PATH = Path("data/cache/geocode_cache.json")
+_DISK_CACHE_TTL_SECONDS = 30 * 86400
+_DISK_CACHE: Optional[dict] = None  # lazily loaded
+
+
+def _disk_cache_key(normalized: str) -> str:
+    """Case-fold the normalized address so equivalent inputs share an entry."""
+    return normalized.lower()
+
+
+def _load_disk_cache() -> dict:
+    global _DISK_CACHE
+    if _DISK_CACHE is None:
+        try:
+            _DISK_CACHE = json.loads(_DISK_CACHE_PATH.read_text(encoding="utf-8"))
+        except Exception:
+            _DISK_CACHE = {}
+    return _DISK_CACHE
+
+
+def _disk_cache_get(key: str) -> Optional[Tuple[float, float]]:
+    entry = _load_disk_cache().get(key)
+    if not entry:
+        return None
+    if time.time() - entry.get("timestamp", 0) > _DISK_CACHE_TTL_SECONDS:
+        return None
+    return entry["lat"], entry["lon"]
+
+
+def _disk_cache_put(key: str, lat: float, lon: float) -> None:
+    cache = _load_disk_cache()
+    cache[key] = {"lat": lat, "lon": lon, "timestamp": time.time()}
+    try:
+        _DISK_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _DISK_CACHE_PATH.write_text(json.dumps(cache), encoding="utf-8")
+    except Exception:
+        # Persistence is best-effort; the in-memory copy still serves hits.
+        pass
+
 
 def _normalize_address(address: str) -> str:
     """Collapse whitespace for consistent geocoder cache keys."""
@@ -54,10 +100,18 @@ def geocode_address(address: str) -> Optional[Tuple[float, float]]:
 
 @st.cache_data(ttl=60 * 60 * 24)
 def _geocode_address_cached(normalized: str) -> Optional[Tuple[float, float]]:
+    # Check the persistent cache first: a hit skips the network round-trip
+    # and the rate-limiter delay entirely.
+    key = _disk_cache_key(normalized)
+    cached = _disk_cache_get(key)
+    if cached is not None:
+        return cached
+
     try:
         geocode_fn = _get_rate_limited_geocoder()
         location = geocode_fn(normalized)
         if location:
+            _disk_cache_put(key, location.latitude, location.longitude)
             return location.latitude, location.longitude
         return None
     except (GeocoderTimedOut, GeocoderServiceError):
@@ -47,6 +47,35 @@ def format_phone_number(phone):
         return str(phone) if phone is not None else None
 
 
+_PHONE10_RE = re.compile(r"^(\d{3})(\d{3})(\d{4})$")
+
+
+def format_phone_column(s: pd.Series) -> pd.Series:
+    """
+    Vectorized counterpart of format_phone_number for whole columns.
+
+    Runs as a handful of regex passes over the column in C instead of a
+    Python call per row. Values that don't reduce to a 10-digit number
+    (after stripping punctuation and a leading country code) pass through
+    unformatted, matching the scalar function's behavior.
+
+    Args:
+        s: Series of phone numbers as float, int, or string
+
+    Returns:
+        Series of formatted phone strings (pandas "string" dtype)
+    """
+    text = s.astype("string")
+    # Values coming from float columns render like '4435140560.0'
+    digits = (
+        text.str.replace(r"\.0$", "", regex=True)
+        .str.replace(r"\D", "", regex=True)
+        .str.replace(r"^1(\d{10})$", r"\1", regex=True)
+    )
+    formatted = digits.str.replace(_PHONE10_RE, r"(\1) \2-\3", regex=True)
+    return formatted.where(digits.str.fullmatch(r"\d{10}"), text)
+
+
 def get_word_bytes(best_provider: pd.Series) -> bytes:
     doc = Document()
     doc.add_heading("Recommended Provider", 0)
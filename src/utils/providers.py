@@ -102,6 +102,24 @@ def calculate_time_based_referral_counts(
     return time_based_counts
 
 
+_PROVIDER_PROJECTION_COLS = ("Full Name", "Street", "City", "State", "Zip", "Latitude", "Longitude")
+
+
+def _project_referral_columns(df: pd.DataFrame, column_mapping: dict) -> pd.DataFrame:
+    """Build a narrow provider frame from raw referral columns.
+
+    Raw columns are renamed per column_mapping; provider columns already
+    present under their final name pass through when the mapping doesn't
+    supply them. Only the projected columns are materialized — the wide
+    referral frame is never copied.
+    """
+    cols = {new_col: df[old_col] for old_col, new_col in column_mapping.items() if old_col in df.columns}
+    for col in _PROVIDER_PROJECTION_COLS:
+        if col not in cols and col in df.columns:
+            cols[col] = df[col]
+    return pd.DataFrame(cols)
+
+
 def calculate_inbound_referral_counts(
     inbound_df: pd.DataFrame, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None
 ) -> pd.DataFrame:
@@ -114,7 +132,9 @@ def calculate_inbound_referral_counts(
     if inbound_df.empty:
         return pd.DataFrame()
 
-    df_copy = inbound_df.copy()
+    # No step below mutates the input, so work on it directly — reset_index
+    # and the date mask each produce new frames of their own
+    df_copy = inbound_df
     date_col = _detect_date_column(df_copy)
 
     if date_col == df_copy.index.name:
@@ -174,11 +194,9 @@ def calculate_inbound_referral_counts(
         "Referred From's Details: Longitude": "Longitude",
     }
 
-    # Create primary referrals dataframe
-    primary_df = filtered_df.copy()
-    for old_col, new_col in primary_cols.items():
-        if old_col in primary_df.columns:
-            primary_df[new_col] = primary_df[old_col]
+    # Project just the provider columns instead of copying the whole
+    # filtered frame and aliasing columns onto it
+    primary_df = _project_referral_columns(filtered_df, primary_cols)
 
     # Process secondary referral source if available
     secondary_cols = {
@@ -191,14 +209,10 @@ def calculate_inbound_referral_counts(
         "Secondary Referred From's Details: Longitude": "Longitude",
     }
 
-    secondary_df = filtered_df.copy()
-    for old_col, new_col in secondary_cols.items():
-        if old_col in secondary_df.columns:
-            secondary_df[new_col] = secondary_df[old_col]
-
     # Remove rows where secondary referral data is missing
-    if "Secondary Referred From Full Name" in secondary_df.columns:
-        secondary_df = secondary_df.dropna(subset=["Secondary Referred From Full Name"])
+    if "Secondary Referred From Full Name" in filtered_df.columns:
+        secondary_df = _project_referral_columns(filtered_df, secondary_cols)
+        secondary_df = secondary_df.dropna(subset=["Full Name"])
     else:
         secondary_df = pd.DataFrame()  # No secondary data available
 
@@ -276,9 +290,9 @@ def load_and_validate_provider_data(
     Raises:
         Exception: If data loading or validation fails
     """
-    from ..data.ingestion import DataIngestionManager, DataSource
+    from ..data.ingestion import DataSource, get_data_manager
 
-    manager = DataIngestionManager()
+    manager = get_data_manager()
     df = manager.load_data(DataSource.PROVIDER_DATA, show_status=False)
 
     if df.empty:
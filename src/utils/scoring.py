@@ -77,21 +77,47 @@ def _rank_normalize(values: np.ndarray, higher_is_better: bool = True) -> np.nda
         return (n - ranks) / (n - 1)
 
 
-def calculate_distances(user_lat: float, user_lon: float, provider_df: pd.DataFrame) -> List[Optional[float]]:
+def calculate_distances(user_lat: float, user_lon: float, provider_df: pd.DataFrame) -> np.ndarray:
+    """Vectorized haversine from the user to every provider, in miles.
+
+    Returns a float64 array aligned with provider_df; rows with missing
+    coordinates come back NaN. The whole computation stays in NumPy — no
+    per-element Python conversion on the way out.
+    """
     lat_arr = np.radians(provider_df["Latitude"].to_numpy(dtype=float))
     lon_arr = np.radians(provider_df["Longitude"].to_numpy(dtype=float))
     user_lat_rad = np.radians(user_lat)
     user_lon_rad = np.radians(user_lon)
+    cos_ulat = np.cos(user_lat_rad)
 
     valid = ~np.isnan(lat_arr) & ~np.isnan(lon_arr)
-    dlat = lat_arr[valid] - user_lat_rad
-    dlon = lon_arr[valid] - user_lon_rad
-    a = np.sin(dlat / 2) ** 2 + np.cos(user_lat_rad) * np.cos(lat_arr[valid]) * np.sin(dlon / 2) ** 2
-    c = 2 * np.arcsin(np.sqrt(a))
+    all_valid = bool(valid.all())
+    lat_v = lat_arr if all_valid else lat_arr[valid]
+    lon_v = lon_arr if all_valid else lon_arr[valid]
+
+    # The kernel is memory-bound, so it is written with in-place ops over two
+    # scratch arrays (a, b) rather than one fresh temporary per step
+    a = lat_v - user_lat_rad
+    a *= 0.5
+    np.sin(a, out=a)
+    a *= a  # sin^2(dlat/2)
+    b = lon_v - user_lon_rad
+    b *= 0.5
+    np.sin(b, out=b)
+    b *= b  # sin^2(dlon/2)
+    np.cos(lat_v, out=lat_v)
+    lat_v *= cos_ulat
+    b *= lat_v  # cos(ulat)*cos(lat)*sin^2(dlon/2)
+    a += b
+    np.sqrt(a, out=a)
+    np.arcsin(a, out=a)
+    a *= 2 * 3958.8
+
+    if all_valid:
+        return a
     distances = np.full(len(provider_df), np.nan)
-    distances[valid] = 3958.8 * c
-
-    return [None if np.isnan(d) else float(d) for d in distances]
+    distances[valid] = a
+    return distances
 
 
 def _specialty_scores(
@@ -104,18 +130,18 @@ def _specialty_scores(
 
     selected_set = {s.strip() for s in selected_specialties}
     sec_cols = [c for c in ["sec_spec_1", "sec_spec_2", "sec_spec_3", "sec_spec_4"] if c in df.columns]
-    scores = np.zeros(n)
 
-    for i, (_, row) in enumerate(df.iterrows()):
-        pri = str(row.get("Specialty", "")).strip()
-        if pri in selected_set:
-            scores[i] = 1.0
-            continue
+    # Column-at-a-time isin instead of a per-row Python loop: one membership
+    # kernel per specialty column rather than one interpreter round per cell
+    primary = df["Specialty"].astype("string").fillna("").str.strip().isin(selected_set).to_numpy()
+    scores = np.where(primary, 1.0, 0.0)
+
+    if sec_cols:
+        secondary = np.zeros(n, dtype=bool)
         for col in sec_cols:
-            sec = str(row.get(col, "")).strip()
-            if sec and sec in selected_set:
-                scores[i] = 0.5
-                break
+            ser = df[col].astype("string").fillna("").str.strip()
+            secondary |= (ser.ne("") & ser.isin(selected_set)).to_numpy()
+        scores[~primary & secondary] = 0.5
 
     return scores
 
@@ -132,16 +158,17 @@ def recommend_provider(
     selected_specialties: Optional[List[str]] = None,
     experience_floor: float = EXPERIENCE_FLOOR,
     min_clients: Optional[int] = None,
+    top_k: Optional[int] = None,
 ) -> Tuple[Optional[pd.Series], Optional[pd.DataFrame]]:
-    df = provider_df.copy(deep=True)
-    df = df[df["Distance (Miles)"].notnull() & df["Client Count"].notnull()]
+    # Filter before copying: the deep copy of the full input frame was pure
+    # memory traffic, since only the surviving rows are ever touched
+    mask = provider_df["Distance (Miles)"].notnull() & provider_df["Client Count"].notnull()
     if min_clients is not None:
-        df = df[df["Client Count"] >= min_clients]
+        mask &= provider_df["Client Count"] >= min_clients
+    df = provider_df.loc[mask].copy()
     if df.empty:
         return None, None
 
-    n = len(df)
-
     # Rank-normalize distance (lower = better)
     dist_arr = df["Distance (Miles)"].to_numpy(dtype=float)
     rank_dist = _rank_normalize(dist_arr, higher_is_better=False)
@@ -153,14 +180,18 @@ def recommend_provider(
     # Rank-normalize star rating (higher = better); fill missing with median
     if "Rating" in df.columns and star_weight > 0:
         star_arr = df["Rating"].to_numpy(dtype=float)
-        median_star = float(np.nanmedian(star_arr)) if not np.all(np.isnan(star_arr)) else 0.0
-        star_arr = np.where(np.isnan(star_arr), median_star, star_arr)
+        # Compute the NaN mask once and reuse it for the all-missing check,
+        # the median, and the fill — one pass over the column instead of three
+        star_nan = np.isnan(star_arr)
+        median_star = float(np.median(star_arr[~star_nan])) if not star_nan.all() else 0.0
+        star_arr = np.where(star_nan, median_star, star_arr)
         rank_star = _rank_normalize(star_arr, higher_is_better=True)
     else:
-        rank_star = np.ones(n)
+        rank_star = None
 
-    # Specialty match quality
-    spec_scores = _specialty_scores(df, selected_specialties)
+    # Specialty match quality; skipped outright when it carries no weight, so
+    # the default distance+experience preset never touches the isin kernels
+    spec_scores = _specialty_scores(df, selected_specialties) if specialty_weight > 0 else None
 
     # Normalize weights to sum to 1.0
     total = distance_weight + client_weight + star_weight + specialty_weight
@@ -171,15 +202,31 @@ def recommend_provider(
     w_star = star_weight / total
     w_spec = specialty_weight / total
 
-    df = df.copy()
-    df["Score"] = (
-        w_dist * rank_dist
-        + w_client * rank_client
-        + w_star * rank_star
-        + w_spec * spec_scores
-    )
-    df["_proximity_score"] = (w_dist * rank_dist).round(3)
-    df["_experience_score"] = (w_client * rank_client).round(3)
+    # The rank arrays are private to this call, so accumulate the weighted
+    # sum in place — one buffer carries the score instead of a fresh
+    # temporary per term
+    rank_dist *= w_dist
+    rank_client *= w_client
+    df["_proximity_score"] = np.round(rank_dist, 3)
+    df["_experience_score"] = np.round(rank_client, 3)
+    score = rank_dist
+    score += rank_client
+    if rank_star is not None:
+        rank_star *= w_star
+        score += rank_star
+    elif w_star:
+        score += w_star  # all-ones rank folds to a constant shift
+    if spec_scores is not None:
+        spec_scores *= w_spec
+        score += spec_scores
+    df["Score"] = score
+
+    # When the caller only needs the leading rows, select the top-k by Score
+    # with an O(N) partition and leave the O(k log k) multi-key sort to run
+    # on just those rows
+    if top_k is not None and len(df) > top_k:
+        keep = np.argpartition(-df["Score"].to_numpy(), top_k)[:top_k]
+        df = df.iloc[keep]
 
     if distance_weight > client_weight:
         sort_keys = ["Score", "Distance (Miles)", "Client Count"]
@@ -195,5 +242,18 @@ def recommend_provider(
     sort_keys_final = [k for k in sort_keys if k in df.columns]
     ascending_final = ascending[: len(sort_keys_final)]
 
-    df_sorted = df.sort_values(by=sort_keys_final, ascending=ascending_final).reset_index(drop=True)
+    # np.lexsort over plain key arrays skips pandas' generic multi-key sort
+    # machinery; string tie-breakers become lexicographically ordered codes
+    # via np.unique, and descending keys are negated
+    keys = []
+    for col, asc in zip(sort_keys_final, ascending_final):
+        ser = df[col]
+        if pd.api.types.is_numeric_dtype(ser):
+            arr = ser.to_numpy(dtype=float)
+        else:
+            arr = np.unique(ser.to_numpy(), return_inverse=True)[1].astype(float)
+        keys.append(arr if asc else -arr)
+    order = np.lexsort(keys[::-1])  # lexsort treats the last key as primary
+
+    df_sorted = df.iloc[order].reset_index(drop=True)
     return df_sorted.iloc[0], df_sorted
@@ -5,6 +5,10 @@ from unittest.mock import MagicMock
 # @st.cache_data(ttl=...) becomes a passthrough decorator in tests.
 _st = MagicMock()
 _st.cache_data = lambda **kwargs: (lambda func: func)
+# @st.cache_resource is used both bare and with kwargs; passthrough either way.
+_st.cache_resource = lambda *args, **kwargs: (
+    args[0] if args and callable(args[0]) else (lambda func: func)
+)
 _st.warning = lambda *a, **k: None
 _st.error = lambda *a, **k: None
 sys.modules["streamlit"] = _st
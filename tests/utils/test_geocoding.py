@@ -1,9 +1,18 @@
 import pytest
 from unittest.mock import MagicMock, patch
 from geopy.exc import GeocoderTimedOut, GeocoderServiceError
+
+import src.utils.geocoding as geocoding
 from src.utils.geocoding import _normalize_address, geocode_address
 
 
+@pytest.fixture(autouse=True)
+def _isolated_disk_cache(tmp_path, monkeypatch):
+    """Point the persistent geocode cache at a temp file per test."""
+    monkeypatch.setattr(geocoding, "_DISK_CACHE_PATH", tmp_path / "geocode_cache.json")
+    monkeypatch.setattr(geocoding, "_DISK_CACHE", None)
+
+
 def test_strips_leading_trailing_whitespace():
     assert _normalize_address("  100 N Charles St  ") == "100 N Charles St"
 
@@ -83,6 +92,54 @@ def test_geocode_address_returns_none_on_service_error():
     assert result is None
 
 
+def test_geocode_address_repeat_lookup_skips_geocoder():
+    """Second lookup of the same address is served from the disk cache."""
+    call_count = [0]
+
+    def capture(addr, timeout=10):
+        call_count[0] += 1
+        return _make_location(39.29, -76.61)
+
+    with patch("src.utils.geocoding._get_rate_limited_geocoder") as mock_factory:
+        mock_factory.return_value = capture
+        first = geocode_address("100 N Charles St, Baltimore, MD 21201")
+        second = geocode_address("100 N CHARLES ST, BALTIMORE, MD 21201")
+
+    assert call_count[0] == 1
+    assert first == second == pytest.approx((39.29, -76.61))
+
+
+def test_geocode_address_disk_cache_persists_across_reload():
+    """Cache entries written by one process are readable after a cache reload."""
+    with patch("src.utils.geocoding._get_rate_limited_geocoder") as mock_factory:
+        mock_factory.return_value = lambda addr, timeout=10: _make_location(39.29, -76.61)
+        geocode_address("100 N Charles St, Baltimore, MD 21201")
+
+    # Simulate a fresh process: drop the in-memory copy, keep the file
+    geocoding._DISK_CACHE = None
+
+    def fail(addr, timeout=10):
+        raise AssertionError("geocoder should not be called on a disk-cache hit")
+
+    with patch("src.utils.geocoding._get_rate_limited_geocoder") as mock_factory:
+        mock_factory.return_value = fail
+        result = geocode_address("100 N Charles St, Baltimore, MD 21201")
+
+    assert result == pytest.approx((39.29, -76.61))
+
+
+def test_geocode_address_expired_disk_entry_refetches():
+    """Entries older than the TTL are ignored and re-geocoded."""
+    key = geocoding._disk_cache_key("100 N Charles St, Baltimore, MD 21201")
+    geocoding._load_disk_cache()[key] = {"lat": 1.0, "lon": 2.0, "timestamp": 0}
+
+    with patch("src.utils.geocoding._get_rate_limited_geocoder") as mock_factory:
+        mock_factory.return_value = lambda addr, timeout=10: _make_location(39.29, -76.61)
+        result = geocode_address("100 N Charles St, Baltimore, MD 21201")
+
+    assert result == pytest.approx((39.29, -76.61))
+
+
 import pandas as pd
 from src.utils.geocoding import geocode_provider_dataframe
 